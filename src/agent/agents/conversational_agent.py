@@ -1,21 +1,29 @@
-import json
+import functools
 import os
-import httpx
-from typing import Any, Dict, List, Tuple
-
-import shortuuid
-import base64
-import psycopg2
 
 from agent.core.base_agent import BaseAgent
-from agent.core.decorators.tool import agent_tool
 from agent.core.memory.message_manager import MessageManager
-from agent.core.providers.open_ai import OpenAIProvider
+from agent.core.providers.model_provider import ModelProvider
 from agent.core.decorators.agent import agent
 from agent.core.interfaces.message_stream import MessageStream
-from fastapi import WebSocketDisconnect
-from db import DatabaseConnection
-from utils.privy_auth import PrivyAuthorizationSigner
+
+CHARACTER_PATH = os.path.join(os.path.dirname(__file__), "character", "character.txt")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_character_template() -> str:
+    """Read the character template from disk once per process"""
+    try:
+        with open(CHARACTER_PATH, "r") as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        raise RuntimeError(f"Character file not found at {CHARACTER_PATH}")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_character(agent_name: str) -> str:
+    """Render the character prompt for an agent name, cached per distinct name"""
+    return _load_character_template().replace("{CHARACTER_NAME}", agent_name)
 
 
 @agent
@@ -30,13 +38,13 @@ class ConversationalAgent(BaseAgent):
 
     def __init__(
         self,
+        model_provider: ModelProvider,
         message_manager: MessageManager,
         message_stream: MessageStream,
         agent_name: str,
         debug: bool = False,
     ) -> None:
         """Initialize the conversational agent"""
-        model_provider = OpenAIProvider(debug=debug)
         super().__init__(
             model_provider=model_provider,
             message_manager=message_manager,
@@ -45,28 +53,14 @@ class ConversationalAgent(BaseAgent):
         )
 
         self._agent_name = agent_name
-        self._tools = []
+        self._tools_cache = []
 
-        # Load character text during initialization
-        character_path = os.path.join(
-            os.path.dirname(__file__), "character", "character.txt"
-        )
-        try:
-            with open(character_path, "r") as f:
-                character_template = f.read().strip()
-                self._system_prompt = character_template.replace(
-                    "{CHARACTER_NAME}", self._agent_name
-                )
-        except FileNotFoundError:
-            raise RuntimeError(f"Character file not found at {character_path}")
+        self._system_prompt = _load_character(agent_name)
 
     async def transfer_to(self) -> "BaseAgent":
         """Transfer control to the conversational agent anytime the user seems like they just want to chat"""
         return self
 
-    def _get_tools(self) -> List[Dict[str, Any]]:
-        return self._tools
-
     def get_system_prompt(self) -> str | None:
         return self._system_prompt
 
@@ -1,16 +1,16 @@
+import asyncio
+import functools
 import json
 import os
 import httpx
-from typing import Any, Dict, List, Tuple
+from typing import Dict, Optional, Tuple
 
-import shortuuid
 import base64
-import psycopg2
 
 from agent.core.base_agent import BaseAgent
 from agent.core.decorators.tool import agent_tool
 from agent.core.memory.message_manager import MessageManager
-from agent.core.providers.open_ai import OpenAIProvider
+from agent.core.providers.model_provider import ModelProvider
 from agent.core.decorators.agent import agent
 from agent.core.interfaces.message_stream import MessageStream
 from fastapi import WebSocketDisconnect
@@ -18,6 +18,59 @@ from db import DatabaseConnection
 from utils.privy_auth import PrivyAuthorizationSigner
 
 
+_HTTPX_CLIENT: Optional[httpx.AsyncClient] = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client for Privy API calls, creating it on first use."""
+    global _HTTPX_CLIENT
+    if _HTTPX_CLIENT is None or _HTTPX_CLIENT.is_closed:
+        _HTTPX_CLIENT = httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60),
+            timeout=httpx.Timeout(10.0),
+        )
+    return _HTTPX_CLIENT
+
+
+@functools.lru_cache(maxsize=1)
+def _privy_auth() -> Tuple[PrivyAuthorizationSigner, Dict[str, str]]:
+    """
+    Build the Privy signer and static auth headers from the environment once.
+
+    Returns:
+        Tuple[PrivyAuthorizationSigner, Dict[str, str]]: The signer and the
+            Content-Type/Basic Authorization headers shared by every request
+
+    Raises:
+        ValueError: If PRIVY_APP_ID or PRIVY_APP_SECRET is not set
+    """
+    privy_app_id = os.getenv("PRIVY_APP_ID")
+    privy_app_secret = os.getenv("PRIVY_APP_SECRET")
+
+    if not privy_app_id or not privy_app_secret:
+        raise ValueError(
+            "PRIVY_APP_ID and PRIVY_APP_SECRET environment variables must be set"
+        )
+
+    # Create basic auth header from app_id:app_secret
+    auth_string = f"{privy_app_id}:{privy_app_secret}"
+    basic_auth = base64.b64encode(auth_string.encode()).decode()
+
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": f"Basic {basic_auth}",
+    }
+    return PrivyAuthorizationSigner(privy_app_id), headers
+
+
+async def close_http_client() -> None:
+    """Close the shared Privy HTTP client if it has been created."""
+    global _HTTPX_CLIENT
+    if _HTTPX_CLIENT is not None:
+        await _HTTPX_CLIENT.aclose()
+        _HTTPX_CLIENT = None
+
+
 class AgentNameValidationError(ValueError):
     """Base exception for agent name validation errors."""
 
@@ -37,13 +90,23 @@ class IntroAgent(BaseAgent):
 
     def __init__(
         self,
+        model_provider: ModelProvider,
         message_manager: MessageManager,
         message_stream: MessageStream,
         user_id: str,
+        db_connection: DatabaseConnection,
         debug: bool = False,
     ) -> None:
-        """Initialize the intro agent"""
-        model_provider = OpenAIProvider(debug=debug)
+        """Initialize the intro agent
+
+        Args:
+            model_provider: Shared provider for model interactions
+            message_manager: Manager for conversation history
+            message_stream: Stream for sending/receiving messages
+            user_id: The ID of the user registering agents
+            db_connection: Shared database connection pool
+            debug: Enable debug logging if True
+        """
         super().__init__(
             model_provider=model_provider,
             message_manager=message_manager,
@@ -52,8 +115,8 @@ class IntroAgent(BaseAgent):
         )
 
         self._user_id = user_id
-        self._tools = [self.create_agent_wizard.tool_metadata.description]
-        self._db = DatabaseConnection()
+        self._tools_cache = [self.create_agent_wizard.tool_metadata.description]
+        self._db = db_connection
 
     async def _create_privy_wallet(self) -> Tuple[str, str]:
         """
@@ -63,53 +126,34 @@ class IntroAgent(BaseAgent):
             Tuple[str, str]: A tuple containing (wallet_id, wallet_address)
         """
         self._logger.debug("Starting Privy wallet creation")
-        privy_app_id = os.getenv("PRIVY_APP_ID")
-
-        privy_app_secret = os.getenv("PRIVY_APP_SECRET")
-
-        if not privy_app_id or not privy_app_secret:
-            raise ValueError(
-                "PRIVY_APP_ID and PRIVY_APP_SECRET environment variables must be set"
-            )
-
-        # Initialize the Privy signer
-        privy_signer = PrivyAuthorizationSigner(privy_app_id)
+        privy_signer, base_headers = _privy_auth()
 
         url = "https://api.privy.io/v1/wallets"
         body = {"chain_type": "ethereum"}
 
-        # Create basic auth header from app_id:app_secret
-        auth_string = f"{privy_app_id}:{privy_app_secret}"
-        basic_auth = base64.b64encode(auth_string.encode()).decode()
+        # Only the request signature depends on the payload
+        headers = {**base_headers, **await privy_signer.get_auth_headers(url, body)}
 
-        # Get authorization headers
-        headers = await privy_signer.get_auth_headers(url, body)
-        headers["Content-Type"] = "application/json"
-        headers["Authorization"] = f"Basic {basic_auth}"
+        client = _get_http_client()
+        response = await client.post(
+            url,
+            json=body,
+            headers=headers,
+        )
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                url,
-                json=body,
-                headers=headers,
+        if response.status_code != 200:
+            self._logger.error(
+                f"Privy API error: {response.status_code} - {response.text}"
             )
+            raise Exception(f"Failed to create Privy wallet: {response.text}")
 
-            if response.status_code != 200:
-                self._logger.error(
-                    f"Privy API error: {response.status_code} - {response.text}"
-                )
-                raise Exception(f"Failed to create Privy wallet: {response.text}")
-
-            data = response.json()
-            return data["id"], data["address"]
+        data = response.json()
+        return data["id"], data["address"]
 
     def transfer_to(self) -> "BaseAgent":
         """Transfer control to the intro agent for handling information about the system and registering new agents"""
         return self
 
-    def _get_tools(self) -> List[Dict[str, Any]]:
-        return self._tools
-
     def get_system_prompt(self) -> str | None:
         return """[MODE: IMMUTABLE] You are an agent responsible for introducing the user to the system and helping them register new agents.
         You will be given a tool to create a new agent and may only use this tool. All other requests should be politely declined.
@@ -149,25 +193,45 @@ class IntroAgent(BaseAgent):
             )
 
         try:
-            with self._db.get_connection() as conn:
-                with conn.cursor() as cur:
-                    # Create the agent
-                    cur.execute(
-                        "INSERT INTO agents (wallet_id, name, wallet_address) VALUES (%s, %s, %s) RETURNING id",
-                        (wallet_id, sanitized_name, wallet_address),
-                    )
-                    agent_id = cur.fetchone()[0]
-
-                    # Create user-agent mapping
-                    cur.execute(
-                        "INSERT INTO user_agent_mapping (user_id, agent_id) VALUES (%s, %s)",
-                        (user_id, agent_id),
-                    )
-                    conn.commit()
+            # psycopg2 is blocking, so run it off the event loop
+            await asyncio.to_thread(
+                self._insert_agent, sanitized_name, wallet_id, wallet_address, user_id
+            )
         except Exception as e:
             self._logger.error(f"Unexpected error while creating agent: {str(e)}")
             raise
 
+    def _insert_agent(
+        self, name: str, wallet_id: str, wallet_address: str, user_id: str
+    ) -> None:
+        """
+        Insert the agent and its user mapping. Blocks on the database.
+
+        Args:
+            name: The validated agent name
+            wallet_id: The wallet ID associated with the agent
+            wallet_address: The wallet address of the agent
+            user_id: The ID of the user creating the agent
+        """
+        with self._db.get_connection() as conn:
+            with conn.cursor() as cur:
+                # Create the agent and its user mapping in a single round-trip
+                cur.execute(
+                    """
+                    WITH new_agent AS (
+                        INSERT INTO agents (wallet_id, name, wallet_address)
+                        VALUES (%s, %s, %s)
+                        RETURNING id
+                    )
+                    INSERT INTO user_agent_mapping (user_id, agent_id)
+                    SELECT %s, id FROM new_agent
+                    RETURNING agent_id
+                    """,
+                    (wallet_id, name, wallet_address, user_id),
+                )
+                cur.fetchone()
+                conn.commit()
+
     @agent_tool()
     async def create_agent_wizard(self) -> None:
         """
@@ -179,7 +243,7 @@ class IntroAgent(BaseAgent):
         self._logger.debug("Starting agent creation wizard")
         try:
             # Get agent name from user
-            message_id = shortuuid.uuid()
+            message_id = self._next_msg_id()
             await self._message_stream.send_message(
                 json.dumps(
                     {
@@ -1,9 +1,9 @@
-from typing import Any, Dict, List
+from typing import List
 
 from agent.core.base_agent import BaseAgent
 from agent.core.decorators.tool import ToolMetadata
 from agent.core.memory.message_manager import MessageManager
-from agent.core.providers.open_ai import OpenAIProvider
+from agent.core.providers.model_provider import ModelProvider
 from agent.core.decorators.agent import agent
 from agent.core.interfaces.message_stream import MessageStream
 
@@ -21,13 +21,13 @@ class RoutingAgent(BaseAgent):
     def __init__(
         self,
         agents: List[BaseAgent],
+        model_provider: ModelProvider,
         message_manager: MessageManager,
         message_stream: MessageStream,
         debug: bool = False,
     ) -> None:
         """Initialize the routing agent"""
         self._agents = agents
-        model_provider = OpenAIProvider(debug=debug)
         super().__init__(
             model_provider=model_provider,
             message_manager=message_manager,
@@ -35,22 +35,17 @@ class RoutingAgent(BaseAgent):
             debug=debug,
         )
 
-        self._tools = []
+        tools = []
         for agent in self._agents:
-            for method_name in dir(agent):
-                if method_name.startswith("transfer_to"):
-                    method = getattr(agent, method_name)
-                    if hasattr(method, "tool_metadata"):
-                        metadata: ToolMetadata = method.tool_metadata
-                        self._tools.append(metadata.description)
+            for method_name in agent._TRANSFER_METHODS:
+                metadata: ToolMetadata = getattr(agent, method_name).tool_metadata
+                tools.append(metadata.description)
+        self._tools_cache = sorted(tools, key=lambda tool: tool["function"]["name"])
 
     def transfer_to(self) -> "BaseAgent":
         """Transfer control to the routing agent for handling routing to other agents"""
         return self
 
-    def _get_tools(self) -> List[Dict[str, Any]]:
-        return self._tools
-
     def get_system_prompt(self) -> str | None:
         return """You are a routing agent that directs user requests to specialized agents.
         Analyze the previous user message and determine which agent would be best suited to handle it.
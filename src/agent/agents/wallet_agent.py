@@ -1,18 +1,46 @@
 import json
 import os
-import shortuuid
 from typing import Optional, Dict
 from decimal import Decimal
 
 from agent.core.base_agent import BaseAgent
 from agent.core.memory.message_manager import MessageManager
-from agent.core.providers.open_ai import OpenAIProvider
+from agent.core.providers.model_provider import ModelProvider
 from agent.core.decorators.tool import agent_tool
 from agent.types.agent_info import AgentInfo
 from wallet.wallet import ZWallet
 from agent.core.decorators.agent import agent
 from agent.core.interfaces.message_stream import MessageStream
 
+# Compact encoder shared by every outbound status message
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# 10**decimals for every ERC20 decimals value in practical use; other values are
+# computed on demand
+_DECIMAL_SCALE: Dict[int, Decimal] = {i: Decimal(10) ** i for i in range(0, 37)}
+
+
+def _encode_status(message_type: str, message_id: str, status: Dict) -> str:
+    """Encode a transaction or swap status update for the message stream
+
+    Args:
+        message_type: The outbound message type (e.g. "transaction", "swap_status")
+        message_id: The client-side message identifier
+        status: Status dict with message, transaction_hash and status keys
+
+    Returns:
+        str: The JSON encoded message
+    """
+    return _JSON_ENCODER.encode(
+        {
+            "type": message_type,
+            "id": message_id,
+            "message": status.get("message"),
+            "txHash": status.get("transaction_hash") or "",
+            "status": status.get("status"),
+        }
+    )
+
 
 @agent
 class WalletAgent(BaseAgent):
@@ -28,6 +56,7 @@ class WalletAgent(BaseAgent):
     def __init__(
         self,
         wallet: ZWallet,
+        model_provider: ModelProvider,
         message_manager: MessageManager,
         message_stream: MessageStream,
         agent_data: AgentInfo,
@@ -37,13 +66,13 @@ class WalletAgent(BaseAgent):
 
         Args:
             wallet: Wallet instance for blockchain interactions
+            model_provider: Shared provider for model interactions
             message_manager: Manager for conversation history
             message_stream: Stream for sending/receiving messages
             debug: Enable debug logging if True
         """
         self._wallet = wallet
         self._agent_data = agent_data
-        model_provider = OpenAIProvider(debug=debug)
         super().__init__(
             model_provider=model_provider,
             message_manager=message_manager,
@@ -77,7 +106,7 @@ class WalletAgent(BaseAgent):
         """
         return self
 
-    @agent_tool()
+    @agent_tool(concurrent=True)
     async def get_balances(self) -> Dict[str, any]:
         """
         Get the balance of the ETH in the wallet.
@@ -112,21 +141,11 @@ class WalletAgent(BaseAgent):
 
         # Send pending status
         await self._message_stream.send_message(
-            json.dumps(
-                {
-                    "type": "transaction",
-                    "id": shortuuid.uuid(name="pending"),
-                    "message": status.get("message"),
-                    "txHash": status.get("transaction_hash") or "",
-                    "status": status.get("status"),
-                }
-            )
+            _encode_status("transaction", self._next_msg_id(), status)
         )
 
         # Wait for receipt and get final status
-        receipt = await self._wallet._web3.eth.wait_for_transaction_receipt(
-            status["transaction_hash"], poll_latency=0.5
-        )
+        receipt = await self._wallet.wait_for_receipt(status["transaction_hash"])
 
         final_status = {
             "status": "success" if receipt["status"] == 1 else "failed",
@@ -140,18 +159,10 @@ class WalletAgent(BaseAgent):
 
         # Send final status
         await self._message_stream.send_message(
-            json.dumps(
-                {
-                    "type": "transaction",
-                    "id": shortuuid.uuid(name="final"),
-                    "message": final_status.get("message"),
-                    "txHash": final_status.get("transaction_hash") or "",
-                    "status": final_status.get("status"),
-                }
-            )
+            _encode_status("transaction", self._next_msg_id(), final_status)
         )
 
-        return json.dumps(final_status)
+        return _JSON_ENCODER.encode(final_status)
 
     @agent_tool(
         descriptions={
@@ -198,9 +209,9 @@ class WalletAgent(BaseAgent):
         )
 
         # Broadcast quote message
-        quote_message_id = shortuuid.uuid()
+        quote_message_id = self._next_msg_id()
         await self._message_stream.send_message(
-            json.dumps(
+            _JSON_ENCODER.encode(
                 {
                     "type": "swap_quote",
                     "id": quote_message_id,
@@ -220,8 +231,9 @@ class WalletAgent(BaseAgent):
 
         # If min_amount_out is specified, validate the quote
         if min_amount_out is not None:
-            estimated_out = Decimal(quote["estimate"]["toAmount"]) / Decimal(
-                10**token_out_info.decimals
+            decimals = token_out_info["decimals"]
+            estimated_out = Decimal(quote["estimate"]["toAmount"]) / (
+                _DECIMAL_SCALE.get(decimals) or Decimal(10) ** decimals
             )
             if estimated_out < min_amount_out:
                 raise ValueError(
@@ -229,18 +241,10 @@ class WalletAgent(BaseAgent):
                 )
 
         # Execute the swap
-        swap_message_id = shortuuid.uuid()
+        swap_message_id = self._next_msg_id()
         async for status in lifi_adapter.swap(quote):
             await self._message_stream.send_message(
-                json.dumps(
-                    {
-                        "type": "swap_status",
-                        "id": swap_message_id,
-                        "message": status.get("message"),
-                        "txHash": status.get("transaction_hash") or "",
-                        "status": status.get("status"),
-                    }
-                )
+                _encode_status("swap_status", swap_message_id, status)
             )
 
-        return json.dumps(status)
+        return _JSON_ENCODER.encode(status)
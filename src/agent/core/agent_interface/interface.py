@@ -28,10 +28,12 @@ async def chat_loop(runtime: Runtime) -> None:
 
     # Initialize spinner
     spinner = Halo(text="Agent is thinking...", spinner="dots")
+    loop = asyncio.get_running_loop()
 
     while True:
         try:
-            user_input = input("\nYou: ").strip()
+            # Read input in a worker thread so background tasks keep running
+            user_input = (await loop.run_in_executor(None, input, "\nYou: ")).strip()
 
             if user_input.lower() in ["exit", "quit"]:
                 print("\nGoodbye! 👋")
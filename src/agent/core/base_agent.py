@@ -1,15 +1,36 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, AsyncGenerator
+from typing import (
+    List,
+    Dict,
+    Any,
+    Optional,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Tuple,
+)
+import itertools
+import json
 import logging
-from agent.core.memory.message_manager import MessageManager
+from agent.core.memory.message_manager import MessageManager, RESERVED_SLOTS
 from agent.core.providers.model_provider import ModelProvider
 from agent.core.decorators.tool import ToolMetadata
 from agent.core.interfaces.message_stream import MessageStream
+from utils.ids import new_id
 
 
 class BaseAgent(ABC):
     """Base class for all specialized agents in the system"""
 
+    # Names of the transfer_to_* tools registered by the @agent decorator
+    _TRANSFER_METHODS: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Build the tool registry when an agent class is defined, so no instance
+        or runtime has to scan the class for tools"""
+        super().__init_subclass__(**kwargs)
+        cls._tool_registry()
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -43,11 +64,25 @@ class BaseAgent(ABC):
         self._model_provider = model_provider
         self._message_manager = message_manager
         self._message_stream = message_stream
+        self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._tools_json: Optional[str] = None
+
+        # Built on first generate, once subclasses have finished initializing
+        self._system_message: Optional[Dict[str, Any]] = None
+        self._capabilities_message: Optional[Dict[str, Any]] = None
+
+        # Message ids only need to be unique per session
+        self._session_prefix = new_id()
+        self._msg_seq = itertools.count()
 
     @abstractmethod
     def get_system_prompt(self) -> Optional[str]:
         """Return the system prompt for this agent, if any
 
+        The prompt is sent ahead of the conversation on every turn, so it should
+        be identical between calls to benefit from provider prompt caching. It is
+        read once, on the first call to `generate`, and reused afterwards.
+
         Returns:
             Optional[str]: The system prompt defining the agent's role and capabilities,
                           or None if no system prompt is needed
@@ -72,48 +107,191 @@ class BaseAgent(ABC):
         pass
 
     def _get_tools(self) -> List[Dict[str, Any]]:
-        """Get all tools available to this agent. This method can be overridden by subclasses
-        to provide custom tool discovery logic.
+        """Get all tools available to this agent. Tool metadata is fixed at class
+        definition, so the list is shared by every instance of the class. Subclasses
+        with a fixed tool list can assign `self._tools_cache` directly in `__init__`.
+
+        Returns:
+            List[Dict[str, Any]]: List of tool descriptions, sorted by name so the
+                                  prompt prefix stays stable between turns
+        """
+        if self._tools_cache is None:
+            self._tools_cache = self._discover_tools()
+        return self._tools_cache
+
+    def _get_tools_json(self) -> str:
+        """Get the tool descriptions encoded as a JSON array, encoded once per agent
 
         Returns:
-            List[Dict[str, Any]]: List of tool descriptions
+            str: Compact JSON with sorted keys, matching the provider's encoding
         """
-        tools = []
+        if self._tools_json is None:
+            self._tools_json = json.dumps(
+                self._get_tools(), sort_keys=True, separators=(",", ":")
+            )
+        return self._tools_json
 
-        # Get relevant agent tools
-        for method_name in dir(self):
-            method = getattr(self, method_name)
-            if hasattr(method, "tool_metadata"):
-                metadata: ToolMetadata = method.tool_metadata
-                if not metadata.exclude:
-                    tools.append(metadata.description)
+    @classmethod
+    def _tool_registry(cls) -> Dict[str, ToolMetadata]:
+        """Get the tool metadata of this class keyed by method name. The registry is
+        built once per class by walking the MRO and is stored as `_TOOL_REGISTRY`.
+
+        Returns:
+            Dict[str, ToolMetadata]: Tool metadata sorted by method name, including
+                excluded tools
+        """
+        registry = cls.__dict__.get("_TOOL_REGISTRY")
+        if registry is None:
+            found: Dict[str, ToolMetadata] = {}
+            # Walk base classes first so subclass definitions take precedence
+            for klass in reversed(cls.__mro__):
+                for method_name, value in vars(klass).items():
+                    metadata = getattr(value, "tool_metadata", None)
+                    if metadata is not None:
+                        found[method_name] = metadata
+                    else:
+                        found.pop(method_name, None)
+            registry = dict(sorted(found.items()))
+            cls._TOOL_REGISTRY = registry
+        return registry
 
-        return tools
+    @classmethod
+    def _reset_tool_registry(cls) -> None:
+        """Drop the cached tool registry and tool list after tools were added to the
+        class, so they are rebuilt on next access"""
+        for attr in ("_TOOL_REGISTRY", "_cached_tools"):
+            if attr in cls.__dict__:
+                delattr(cls, attr)
 
-    def _debug_log(self, message: str, data: Optional[Any] = None) -> None:
+    @classmethod
+    def _discover_tools(cls) -> List[Dict[str, Any]]:
+        """Discover the tools decorated on this agent class. The result is computed
+        once per class and stored as `_cached_tools`. This method can be overridden
+        by subclasses to provide custom tool discovery logic.
+
+        Returns:
+            List[Dict[str, Any]]: List of tool descriptions sorted by method name
+        """
+        cached_tools = cls.__dict__.get("_cached_tools")
+        if cached_tools is None:
+            cached_tools = [
+                metadata.description
+                for metadata in cls._tool_registry().values()
+                if not metadata.exclude
+            ]
+            cls._cached_tools = cached_tools
+        return cached_tools
+
+    def _next_msg_id(self) -> str:
+        """Get a unique identifier for an outbound message
+
+        Returns:
+            str: The session prefix followed by a monotonically increasing counter
+        """
+        return f"{self._session_prefix}-{next(self._msg_seq)}"
+
+    def _debug_log(self, message: str, *args: Any) -> None:
         """Log debug information if debug mode is enabled
 
         Args:
-            message: Debug message to log
-            data: Optional data to include in debug output
+            message: Debug message to log, with %-style placeholders
+            *args: Values for the placeholders, formatted only if the message is
+                   emitted
         """
-        if self._debug and self._logger:
-            if data:
-                self._logger.debug(f"{message}: {data}")
-            else:
-                self._logger.debug(message)
+        if self._logger:
+            self._logger.debug(message, *args)
+
+    def _prepare_messages(self, capabilities: str) -> None:
+        """Fill the system and capabilities slots of the message history
+
+        Args:
+            capabilities: The capabilities text sent with the request
+        """
+        if self._system_message is None:
+            self._system_message = self._model_provider.build_system_message(
+                self.get_system_prompt()
+            )
+        if (
+            self._capabilities_message is None
+            or self._capabilities_message["content"] != capabilities
+        ):
+            self._capabilities_message = {"role": "developer", "content": capabilities}
+
+        # Fill the reserved leading slots in place instead of copying the history
+        self._message_manager.set_system(self._system_message)
+        self._message_manager.set_capabilities(self._capabilities_message)
 
     async def generate(self, capabilities: str) -> AsyncGenerator[str, None]:
         """Generate a response using the model provider"""
-        messages = self._message_manager.get_messages()
         tools = self._get_tools()
-        system_message = {"role": "developer", "content": self.get_system_prompt()}
-        capabilities_message = {"role": "developer", "content": capabilities}
+        self._prepare_messages(capabilities)
 
         response = await self._model_provider.generate(
-            messages=[system_message, capabilities_message] + messages,
+            messages=self._message_manager.get_messages(),
             tools=tools,
             stream=True,
+            tools_json=self._get_tools_json() if tools else None,
         )
         async for chunk in response:
             yield chunk
+
+    async def stream_to(
+        self,
+        capabilities: str,
+        send: Callable[[str], Awaitable[None]],
+    ) -> str:
+        """Stream a text-only response straight to a chunk sink, skipping the
+        chunk-by-chunk hand-off through `generate`. Only valid for agents without
+        tools, since tool calls cannot be accumulated on this path.
+
+        Args:
+            capabilities: The capabilities text sent with the request
+            send: Coroutine function called with each text chunk
+
+        Returns:
+            str: The complete response text
+        """
+        if self._get_tools():
+            raise ValueError(f"{self.name} has tools and cannot stream directly")
+
+        self._prepare_messages(capabilities)
+
+        return await self._model_provider.stream_to(
+            send, messages=self._message_manager.get_messages()
+        )
+
+    async def generate_batch(
+        self, capabilities_list: List[str], max_concurrency: int = 8
+    ) -> List[Dict[str, Any]]:
+        """Generate one non-streamed response per capabilities text, concurrently,
+        against the current conversation history. The history is not modified.
+
+        Args:
+            capabilities_list: Capabilities text to send with each request
+            max_concurrency: Maximum number of requests in flight at once
+
+        Returns:
+            List[Dict[str, Any]]: The response message of each request, in the
+                                  order of `capabilities_list`
+        """
+        tools = self._get_tools()
+        if self._system_message is None:
+            self._system_message = self._model_provider.build_system_message(
+                self.get_system_prompt()
+            )
+
+        history = self._message_manager.get_messages()[RESERVED_SLOTS:]
+        messages_list = [
+            [
+                self._system_message,
+                {"role": "developer", "content": capabilities},
+                *history,
+            ]
+            for capabilities in capabilities_list
+        ]
+        return await self._model_provider.generate_batch(
+            messages_list,
+            tools=tools,
+            max_concurrency=max_concurrency,
+            tools_json=self._get_tools_json() if tools else None,
+        )
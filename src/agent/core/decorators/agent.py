@@ -19,8 +19,14 @@ def agent(cls: Type[BaseAgent]) -> Type[BaseAgent]:
 
     @agent_tool(exclude=True, name=method_name)
     @wraps(original_method)
-    async def wrapped_transfer(self, *args, **kwargs):
-        return await original_method(self, *args, **kwargs)
+    async def wrapped_transfer(self):
+        # transfer_to takes no arguments, so skip packing *args/**kwargs
+        return await original_method(self)
 
     setattr(cls, method_name, wrapped_transfer)
+    cls._TRANSFER_METHODS = (method_name,)
+
+    # All tools are in place now, so build the class tool list once
+    cls._reset_tool_registry()
+    cls._discover_tools()
     return cls
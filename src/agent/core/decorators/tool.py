@@ -1,6 +1,16 @@
-from typing import Callable, Dict, Any, Optional, NamedTuple
-from functools import wraps
+from typing import (
+    Callable,
+    Dict,
+    Any,
+    Optional,
+    NamedTuple,
+    Union,
+    get_args,
+    get_origin,
+)
+from functools import lru_cache, wraps
 import inspect
+import types
 from decimal import Decimal
 
 
@@ -12,6 +22,9 @@ class ToolMetadata(NamedTuple):
     exclude: bool = (
         False  # If True, the tool will not be included in the agent's tools list
     )
+    concurrent: bool = (
+        False  # If True, the tool may run alongside other tool calls of a turn
+    )
 
 
 TYPE_MAP = {
@@ -26,12 +39,42 @@ TYPE_MAP = {
 }
 
 
+@lru_cache(maxsize=None)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """Get the signature of a tool function, computed once per function"""
+    return inspect.signature(func)
+
+
+@lru_cache(maxsize=None)
+def _unwrap_optional(annotation: Any) -> Any:
+    """Get the inner type of an `Optional[X]` or `X | None` annotation. Other
+    annotations are returned unchanged.
+
+    Args:
+        annotation: The parameter annotation to unwrap
+    """
+    if get_origin(annotation) not in (Union, types.UnionType):
+        return annotation
+    return next((arg for arg in get_args(annotation) if arg is not type(None)), str)
+
+
+@lru_cache(maxsize=None)
+def _to_schema_type(annotation: Any) -> str:
+    """Map a parameter annotation to its JSON schema type, falling back to string
+
+    Args:
+        annotation: The parameter annotation to map
+    """
+    return TYPE_MAP.get(_unwrap_optional(annotation), "string")
+
+
 def create_tool(
     func: Callable,
     descriptions: Dict[str, str] = None,
     namespace: Optional[str] = None,
     exclude: bool = False,
     name: Optional[str] = None,
+    concurrent: bool = False,
 ) -> ToolMetadata:
     """Convert a wallet function into a tool description with metadata
 
@@ -41,8 +84,9 @@ def create_tool(
         namespace: Optional namespace for routing
         exclude: If True, the tool will not be included in the agent's tools list
         name: Optional name override for the tool
+        concurrent: If True, the tool may run concurrently with other tool calls
     """
-    sig = inspect.signature(func)
+    sig = _cached_signature(func)
     original_func = getattr(func, "__wrapped__", func)
     func_name = name if name is not None else original_func.__name__
     doc = inspect.getdoc(original_func) or ""
@@ -53,18 +97,8 @@ def create_tool(
         if name == "self":
             continue
 
-        # Handle Optional types
-        if (
-            hasattr(param.annotation, "__origin__")
-            and param.annotation.__origin__ is Optional
-        ):
-            param_type = param.annotation.__args__[0]
-        else:
-            param_type = param.annotation
-
-        # Use type map with fallback to string
         parameters[name] = {
-            "type": TYPE_MAP.get(param_type, "string"),
+            "type": _to_schema_type(param.annotation),
             "description": descriptions.get(name, name),
         }
 
@@ -90,7 +124,10 @@ def create_tool(
     }
 
     return ToolMetadata(
-        description=tool_description, namespace=namespace, exclude=exclude
+        description=tool_description,
+        namespace=namespace,
+        exclude=exclude,
+        concurrent=concurrent,
     )
 
 
@@ -99,6 +136,7 @@ def agent_tool(
     namespace: Optional[str] = None,
     exclude: bool = False,
     name: Optional[str] = None,
+    concurrent: bool = False,
 ) -> Callable:
     """Decorator to convert agent methods to tools
 
@@ -107,22 +145,29 @@ def agent_tool(
         namespace: Optional namespace for routing
         exclude: If True, the tool will not be included in the agent's tools list
         name: Optional name override for the tool
+        concurrent: If True, the tool may run concurrently with other tool calls.
+            Only safe for read-only tools that do not prompt the user.
     """
 
     def decorator(func: Callable) -> Callable:
+        decimal_params = frozenset(
+            param_name
+            for param_name, param in _cached_signature(func).parameters.items()
+            if _unwrap_optional(param.annotation) is Decimal
+        )
+
         @wraps(func)
         async def wrapper(self, **kwargs):
             # Convert string amounts to Decimal where needed
-            sig = inspect.signature(func)
-            for param_name, param in sig.parameters.items():
-                if param.annotation == Decimal and param_name in kwargs:
+            for param_name in decimal_params & kwargs.keys():
+                if kwargs[param_name] is not None:
                     kwargs[param_name] = Decimal(kwargs[param_name])
             return await func(self, **kwargs)
 
         # Store tool metadata
         wrapper._param_descriptions = descriptions or {}
         wrapper.tool_metadata = create_tool(
-            func, descriptions, namespace, exclude, name
+            func, descriptions, namespace, exclude, name, concurrent
         )
         return wrapper
 
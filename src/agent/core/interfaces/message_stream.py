@@ -2,16 +2,21 @@ from abc import ABC, abstractmethod
 
 
 class MessageStream(ABC):
+    @property
     @abstractmethod
-    async def is_connected(self) -> bool:
+    def is_connected(self) -> bool:
         """Check if the message stream is still connected"""
         pass
 
-    @abstractmethod
     async def send_message(self, message: str) -> None:
         """Send a message if the connection is still active"""
-        if not await self.is_connected():
-            raise RuntimeError("Cannot send message: connection is closed")
+        if self.is_connected:
+            await self._send_raw(message)
+
+    @abstractmethod
+    async def _send_raw(self, message: str) -> None:
+        """Send a message without checking the connection"""
+        pass
 
     @abstractmethod
     async def send_partial(self, chunk: str) -> None:
@@ -1,12 +1,42 @@
-from typing import List, Dict, Optional
+from typing import Any, List, Dict, Optional, Tuple, Union
 from datetime import datetime
+import time
+from agent.types.message import Message
+
+
+# Leading slots of the message list reserved for the system and capabilities
+# messages, so the list can be sent to the provider without copying the history
+SYSTEM_SLOT = 0
+CAPABILITIES_SLOT = 1
+RESERVED_SLOTS = 2
 
 
 class MessageManager:
     """Manages recent message history and conversations"""
 
     def __init__(self) -> None:
-        self._messages: List[Dict] = []
+        self._messages: List[Optional[Union[Dict, Message]]] = [None] * RESERVED_SLOTS
+        # Positions of the latest user message and of every tool call message
+        self._last_user_idx: Optional[int] = None
+        self._tool_call_indices: List[int] = []
+
+    def set_system(self, message: Dict) -> None:
+        """
+        Set the system message that precedes the conversation
+
+        Args:
+            message: The system message in the provider's format
+        """
+        self._messages[SYSTEM_SLOT] = message
+
+    def set_capabilities(self, message: Dict) -> None:
+        """
+        Set the capabilities message that follows the system message
+
+        Args:
+            message: The capabilities message in the provider's format
+        """
+        self._messages[CAPABILITIES_SLOT] = message
 
     def add_message(
         self,
@@ -22,51 +52,83 @@ class MessageManager:
         Args:
             content: Message content
             role: Role of the message sender
-            timestamp: Optional message timestamp
+            timestamp: Optional message timestamp, stored as epoch seconds
         """
         self._messages.append(
-            {
-                "content": content,
-                "role": role,
-                "tool_calls": tool_calls,
-                "tool_call_id": tool_id,
-                "timestamp": (timestamp or datetime.now()).isoformat(),
-            }
+            Message(
+                content=content,
+                role=role,
+                tool_calls=tool_calls,
+                tool_call_id=tool_id,
+                # Epoch seconds; cheaper than formatting an ISO string per message
+                timestamp=(
+                    timestamp.timestamp() if timestamp is not None else time.time()
+                ),
+            )
         )
+        if role == "user":
+            self._last_user_idx = len(self._messages) - 1
+        if tool_calls:
+            self._tool_call_indices.append(len(self._messages) - 1)
 
-    def get_messages(self) -> List[Dict]:
-        """Get all messages"""
+    def add_tool_results(self, results: List[Tuple[Any, str]]) -> None:
+        """
+        Add the results of several tool calls to the history in one step
+
+        Args:
+            results: Pairs of tool result content and the id of the tool call
+        """
+        timestamp = time.time()
+        self._messages.extend(
+            Message(
+                content=content, role="tool", tool_call_id=tool_id, timestamp=timestamp
+            )
+            for content, tool_id in results
+        )
+
+    def get_messages(self) -> List[Union[Dict, Message]]:
+        """
+        Get all messages, including the system and capabilities messages
+
+        Returns:
+            List[Union[Dict, Message]]: The underlying message list, ready to send to
+                the provider. The leading slots hold provider-format dictionaries,
+                the history holds Message objects.
+        """
         return self._messages
 
-    def get_last_user_message(self) -> Optional[Dict]:
+    def get_last_user_message(self) -> Optional[Message]:
         """
         Get the most recent message from a user
 
         Returns:
-            Optional[Dict]: The last user message as a dictionary, or None if no user messages exist
+            Optional[Message]: The last user message, or None if no user messages exist
         """
-        for message in reversed(self._messages):
-            if message["role"] == "user":
-                return message
-        return None
+        if self._last_user_idx is None:
+            return None
+        return self._messages[self._last_user_idx]
 
-    def get_last_message(self) -> Optional[Dict]:
+    def get_last_message(self) -> Optional[Message]:
         """
         Get the most recent message regardless of role
 
         Returns:
-            Optional[Dict]: The last message as a dictionary, or None if no messages exist
+            Optional[Message]: The last message, or None if no messages exist
         """
-        return self._messages[-1] if self._messages else None
+        return self._messages[-1] if len(self._messages) > RESERVED_SLOTS else None
 
-    def remove_last_tool_call_message(self) -> Optional[Dict]:
+    def remove_last_tool_call_message(self) -> Optional[Message]:
         """
         Removes and returns the most recent message that contains tool calls
 
         Returns:
-            Optional[Dict]: The removed message as a dictionary, or None if no tool call messages exist
+            Optional[Message]: The removed message, or None if no tool call messages exist
         """
-        for i in range(len(self._messages) - 1, -1, -1):
-            if self._messages[i].get("tool_calls"):
-                return self._messages.pop(i)
-        return None
+        if not self._tool_call_indices:
+            return None
+
+        index = self._tool_call_indices.pop()
+        if self._last_user_idx is not None and self._last_user_idx > index:
+            self._last_user_idx -= 1
+        # The tool call message is normally the last one, making this pop O(1)
+        return self._messages.pop(index)
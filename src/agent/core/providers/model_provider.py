@@ -1,6 +1,20 @@
 from abc import ABC, abstractmethod
+import asyncio
 import logging
-from typing import AsyncGenerator, Dict, Any, List, Optional, Union
+from typing import (
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Any,
+    List,
+    Optional,
+    Union,
+)
+
+
+def _noop(*args: Any, **kwargs: Any) -> None:
+    pass
 
 
 class ModelProvider(ABC):
@@ -10,10 +24,30 @@ class ModelProvider(ABC):
         self._logger = None
         if debug:
             self._logger = logging.getLogger(__name__)
+        else:
+            # Shadow the method so disabled logging costs a single no-op call
+            self._debug_log = _noop
 
     def _debug_log(self, message: str, *args: Any):
-        if self._logger:
-            self._logger.debug(message, *args)
+        """Log a debug message, formatting `args` lazily with %-style placeholders"""
+        self._logger.debug(message, *args)
+
+    def build_system_message(self, content: Optional[str]) -> Dict[str, Any]:
+        """
+        Build the system message that prefixes every request
+
+        The default plain message suits providers with automatic prefix caching
+        (e.g. OpenAI). Providers with explicit prompt caching, such as
+        Anthropic-style cache_control blocks, can override this to mark the
+        static prefix as cacheable.
+
+        Args:
+            content: The system prompt text
+
+        Returns:
+            Dict[str, Any]: The system message in the provider's format
+        """
+        return {"role": "developer", "content": content}
 
     @abstractmethod
     def generate(
@@ -48,3 +82,68 @@ class ModelProvider(ABC):
             }
         """
         pass
+
+    async def stream_to(
+        self,
+        send: Callable[[str], Awaitable[None]],
+        messages: List[Dict[str, Any]],
+        **kwargs: Any
+    ) -> str:
+        """
+        Stream a text-only response to a chunk sink as it is generated
+
+        The default implementation consumes `generate`; providers can override it
+        to send chunks straight from the response body.
+
+        Args:
+            send: Coroutine function called with each text chunk
+            messages: List of conversation messages
+            **kwargs: Additional model parameters like temperature, max_tokens, etc.
+
+        Returns:
+            str: The complete response text
+        """
+        parts = []
+        async for chunk in await self.generate(
+            messages=messages, stream=True, **kwargs
+        ):
+            if chunk == "stop":
+                break
+            await send(chunk["content"])
+            parts.append(chunk["content"])
+        return "".join(parts)
+
+    async def generate_batch(
+        self,
+        messages_list: List[List[Dict[str, Any]]],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        max_concurrency: int = 8,
+        **kwargs: Any
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate non-streamed responses for several independent conversations
+
+        Requests run concurrently, at most `max_concurrency` at a time, and share
+        the provider's connections.
+
+        Args:
+            messages_list: One list of conversation messages per request
+            tools: Optional list of tool definitions available to every request
+            max_concurrency: Maximum number of requests in flight at once
+            **kwargs: Additional model parameters passed to each request
+
+        Returns:
+            List[Dict[str, Any]]: The response message of each request, in the
+                                  order of `messages_list`
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def generate_one(messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate(
+                    messages=messages, tools=tools, stream=False, **kwargs
+                )
+
+        return await asyncio.gather(
+            *(generate_one(messages) for messages in messages_list)
+        )
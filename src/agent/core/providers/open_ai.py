@@ -1,10 +1,28 @@
-from typing import Dict, Any, List, Optional, Union, AsyncGenerator
+from typing import (
+    Dict,
+    Any,
+    List,
+    Optional,
+    Union,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+)
 import aiohttp
 import json
 from agent.core.providers.model_provider import ModelProvider
+from agent.types.message import Message
 import os
 from dotenv import load_dotenv
 
+# Server-sent event framing, matched against raw bytes
+_SSE_PREFIX = b"data: "
+_SSE_DONE = b"data: [DONE]"
+_SSE_PREFIX_LEN = len(_SSE_PREFIX)
+
+
+_PAYLOAD_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
 
 class OpenAIProvider(ModelProvider):
     """
@@ -31,8 +49,84 @@ class OpenAIProvider(ModelProvider):
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         assert self.api_key, "OPENAI_API_KEY is not set"
         self.base_url = base_url.rstrip("/")
+        self._session: Optional[aiohttp.ClientSession] = None
         super().__init__(debug=debug)
 
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared HTTP session, creating it on first use
+
+        The session is created lazily because it must be bound to a running
+        event loop.
+
+        Returns:
+            aiohttp.ClientSession: Session with keep-alive connections to the API
+        """
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                connector=aiohttp.TCPConnector(limit=100, keepalive_timeout=75),
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _encode_payload(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: Optional[List[Dict[str, Any]]],
+        stream: bool,
+        **kwargs: Any,
+    ) -> str:
+        """Encode the chat completions request body
+
+        Keys are sorted so identical requests are byte-identical. History messages
+        contribute their cached encoding, so only messages added since the last
+        request are serialized. A pre-encoded JSON array passed as `tools_json` is
+        spliced in as-is rather than re-encoding the tool definitions on every call.
+
+        Args:
+            messages: List of conversation messages
+            tools: Optional list of tool definitions
+            stream: Whether to request a streamed response
+            **kwargs: Additional parameters
+
+        Returns:
+            str: The JSON request body
+        """
+        messages_json = ",".join(
+            (
+                message.to_json()
+                if isinstance(message, Message)
+                else _PAYLOAD_ENCODER.encode(message)
+            )
+            for message in messages
+        )
+        options = {
+            "model": kwargs.get("model", "gpt-3.5-turbo-0125"),
+            "temperature": kwargs.get("temperature", 0.7),
+        }
+        if stream:
+            options["stream"] = True
+        if tools:
+            options["tool_choice"] = kwargs.get("tool_choice", "auto")
+
+        # "messages" sorts before every other key, and "tools" after them
+        body = f'{{"messages":[{messages_json}],{_PAYLOAD_ENCODER.encode(options)[1:]}'
+        if not tools:
+            return body
+
+        tools_json = kwargs.get("tools_json") or json.dumps(
+            tools, sort_keys=True, separators=(",", ":")
+        )
+        return f'{body[:-1]},"tools":{tools_json}}}'
+
     async def generate(
         self,
         messages: List[Dict[str, Any]],
@@ -56,30 +150,15 @@ class OpenAIProvider(ModelProvider):
             return self.generate_stream(messages, tools, **kwargs)
 
         endpoint = f"{self.base_url}/chat/completions"
-        payload = {
-            "messages": messages,
-            "model": kwargs.get("model", "gpt-3.5-turbo-0125"),
-            "temperature": kwargs.get("temperature", 0.7),
-        }
+        body = self._encode_payload(messages, tools, stream=False, **kwargs)
 
-        if tools:
-            payload["tools"] = tools
-            payload["tool_choice"] = kwargs.get("tool_choice", "auto")
-
-        self._debug_log("Payload", payload)
+        self._debug_log("Payload: %s", body)
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                endpoint,
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-            ) as response:
-                response.raise_for_status()
-                response_data = await response.json()
-                return response_data["choices"][0]["message"]
+        async with self._get_session().post(endpoint, data=body) as response:
+            if response.status >= 400:
+                await self._raise_api_error(response)
+            response_data = await response.json()
+            return response_data["choices"][0]["message"]
 
     async def generate_stream(
         self,
@@ -98,87 +177,141 @@ class OpenAIProvider(ModelProvider):
             Chunks of the generated response or complete tool call response
         """
         endpoint = f"{self.base_url}/chat/completions"
-        payload = {
-            "messages": messages,
-            "model": kwargs.get("model", "gpt-3.5-turbo-0125"),
-            "temperature": kwargs.get("temperature", 0.7),
-            "stream": True,
-        }
-
-        if tools:
-            payload["tools"] = tools
-            payload["tool_choice"] = kwargs.get("tool_choice", "auto")
+        body = self._encode_payload(messages, tools, stream=True, **kwargs)
 
         tool_call_response = {}
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                endpoint,
-                json=payload,
-                headers={
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json",
-                },
-            ) as response:
-                response.raise_for_status()
-                async for line in response.content:
-                    if not line:
-                        continue
-
-                    line = line.decode("utf-8").strip()
-                    if not (line.startswith("data: ") and line != "data: [DONE]"):
-                        continue
-
-                    data = json.loads(line[6:])
-                    choice = data["choices"][0]
-
-                    if choice["finish_reason"] == "stop":
-                        yield "stop"
-
-                    # Handle tool calls
-                    if "delta" in choice:
-                        delta = choice["delta"]
-                        self._debug_log("Delta: " + str(delta))
-                        if "tool_calls" in delta:
-                            if "tool_calls" not in tool_call_response:
-                                tool_call_response = delta
-                                if not "content" in tool_call_response:
-                                    tool_call_response["content"] = None
-                            else:
-                                # Merge the new delta into our accumulated response
-                                for new_tool_call in delta["tool_calls"]:
-                                    index = new_tool_call["index"]
-                                    for existing_tool_call in tool_call_response[
-                                        "tool_calls"
-                                    ]:
-                                        if existing_tool_call["index"] == index:
-                                            if "function" in new_tool_call:
-                                                if "function" not in existing_tool_call:
-                                                    existing_tool_call["function"] = {}
-                                                arguments = existing_tool_call[
-                                                    "function"
-                                                ]["arguments"]
-                                                existing_tool_call["function"].update(
-                                                    new_tool_call["function"]
-                                                )
-                                                existing_tool_call["function"][
-                                                    "arguments"
-                                                ] = (
-                                                    arguments
-                                                    + new_tool_call["function"][
-                                                        "arguments"
-                                                    ]
-                                                )
-                                            for key, value in new_tool_call.items():
-                                                if key != "function":
-                                                    existing_tool_call[key] = value
-
-                        # If we've reached the end of tool calls, yield the complete response
-                        elif choice.get("finish_reason") == "tool_calls":
-                            yield tool_call_response
-                            tool_call_response = {}
+        tool_calls_by_index: Dict[int, Dict[str, Any]] = {}
+        async with self._get_session().post(endpoint, data=body) as response:
+            if response.status >= 400:
+                await self._raise_api_error(response)
+            async for data in self._iter_events(response):
+                choice = data["choices"][0]
+
+                if choice["finish_reason"] == "stop":
+                    yield "stop"
+
+                # Handle tool calls
+                if "delta" in choice:
+                    delta = choice["delta"]
+                    self._debug_log("Delta: %s", delta)
+                    if "tool_calls" in delta:
+                        if "tool_calls" not in tool_call_response:
+                            tool_call_response = delta
+                            if not "content" in tool_call_response:
+                                tool_call_response["content"] = None
+                            tool_calls_by_index = {
+                                tool_call["index"]: tool_call
+                                for tool_call in delta["tool_calls"]
+                            }
                         else:
-                            if delta.get("content"):
-                                yield delta
+                            # Merge the new delta into our accumulated response
+                            for new_tool_call in delta["tool_calls"]:
+                                existing = tool_calls_by_index.get(
+                                    new_tool_call["index"]
+                                )
+                                if existing is None:
+                                    tool_calls_by_index[new_tool_call["index"]] = (
+                                        new_tool_call
+                                    )
+                                    tool_call_response["tool_calls"].append(
+                                        new_tool_call
+                                    )
+                                    continue
+
+                                for key, value in new_tool_call.items():
+                                    if key != "function":
+                                        existing[key] = value
+
+                                new_function = new_tool_call.get("function")
+                                if new_function:
+                                    function = existing.setdefault("function", {})
+                                    arguments = function.get("arguments", "")
+                                    function.update(new_function)
+                                    function["arguments"] = arguments + (
+                                        new_function.get("arguments") or ""
+                                    )
+
+                    # If we've reached the end of tool calls, yield the complete response
+                    elif choice.get("finish_reason") == "tool_calls":
+                        yield tool_call_response
+                        tool_call_response = {}
+                    else:
+                        if delta.get("content"):
+                            yield delta
+
+    async def stream_to(
+        self,
+        send: Callable[[str], Awaitable[None]],
+        messages: List[Dict[str, Any]],
+        **kwargs: Any,
+    ) -> str:
+        """Stream a text-only response from OpenAI's API to a chunk sink
+
+        Each content delta is sent as soon as it is parsed, without being handed
+        through the `generate_stream` generator.
+
+        Args:
+            send: Coroutine function called with each text chunk
+            messages: List of conversation messages
+            **kwargs: Additional parameters
+
+        Returns:
+            str: The complete response text
+        """
+        endpoint = f"{self.base_url}/chat/completions"
+        body = self._encode_payload(messages, None, stream=True, **kwargs)
+
+        parts = []
+        async with self._get_session().post(endpoint, data=body) as response:
+            if response.status >= 400:
+                await self._raise_api_error(response)
+            async for data in self._iter_events(response):
+                choice = data["choices"][0]
+                content = choice.get("delta", {}).get("content")
+                if content:
+                    await send(content)
+                    parts.append(content)
+                if choice["finish_reason"] == "stop":
+                    break
+        return "".join(parts)
+
+    @staticmethod
+    async def _raise_api_error(response: aiohttp.ClientResponse) -> None:
+        """Raise an error for a failed API response, including the start of its body
+
+        Args:
+            response: The failed chat completions response
+
+        Raises:
+            OpenAIAPIError: Always
+        """
+        body = await response.text()
+        raise OpenAIAPIError(f"{response.status}: {body[:200]}")
+
+    @staticmethod
+    async def _iter_events(
+        response: aiohttp.ClientResponse,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Parse server-sent events from a streamed response
+
+        Reads whatever bytes are available and splits them into lines, rather
+        than awaiting one line at a time. Lines are parsed as bytes without
+        decoding, since the SSE framing is ASCII.
+
+        Args:
+            response: The streaming chat completions response
+
+        Yields:
+            Dict[str, Any]: Each decoded `data:` payload
+        """
+        buffer = b""
+        async for raw in response.content.iter_any():
+            buffer += raw
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                line = line.strip()
+                if line.startswith(_SSE_PREFIX) and line != _SSE_DONE:
+                    yield json.loads(line[_SSE_PREFIX_LEN:])
 
 
 class OpenAIAPIError(Exception):
@@ -1,12 +1,54 @@
 from abc import ABC
-from typing import Dict, Any, Optional, AsyncGenerator
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Any,
+    List,
+    NamedTuple,
+    Optional,
+    AsyncGenerator,
+    Set,
+    Tuple,
+)
+import asyncio
+import functools
+import itertools
 import json
 import logging
-import shortuuid
 from agent.core.memory.message_manager import MessageManager
 from wallet.wallet import ZWallet
 from agent.core.base_agent import BaseAgent
 from agent.core.interfaces.message_stream import MessageStream
+from agent.core.streams.stream_buffer import StreamBuffer
+from utils.ids import new_id
+
+# Fallback replies streamed to the user when a turn cannot be completed
+_TOOL_FAILURE_REPLY = (
+    "I'm sorry, something went wrong and I was unable to complete your request"
+)
+_GENERATION_ERROR_REPLY = "I apologize, but I encountered an error"
+_INCOMPLETE_REPLY = "Request could not be completed. Please try again."
+
+# Error envelope up to the JSON-encoded error text, matching json.dumps output
+_ERROR_PREFIX = '{"type": "error", "error": '
+
+# Parsed tool arguments are only ever unpacked into calls, so they can be shared
+_EMPTY_ARGS: Dict[str, Any] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_args(arguments: str) -> Dict[str, Any]:
+    """Parse a tool call's JSON arguments, reusing results for repeated strings"""
+    return json.loads(arguments)
+
+
+class ToolResult(NamedTuple):
+    """Outcome of a single tool call"""
+
+    ok: bool  # Whether the tool ran successfully
+    value: Any  # The tool's return value; the target agent for transfers
+    error: str  # The error message if the tool failed
 
 
 class Runtime(ABC):
@@ -49,96 +91,150 @@ class Runtime(ABC):
             [agent.get_capabilities() for agent in self._agents]
         )
 
-    async def _execute_tool(
-        self, tool_call: Dict[str, Any]
-    ) -> Dict[str, str | BaseAgent]:
+        # Tool name to bound method; the first agent providing a tool handles it
+        self._tool_dispatch: Dict[str, Callable[..., Awaitable[Any]]] = {}
+        self._concurrent_tools: Set[str] = set()
+        for agent in self._agents:
+            for method_name, metadata in agent._tool_registry().items():
+                if method_name in self._tool_dispatch:
+                    continue
+                self._tool_dispatch[method_name] = getattr(agent, method_name)
+                if metadata.concurrent:
+                    self._concurrent_tools.add(method_name)
+        self._handoff_tools = frozenset(
+            method_name
+            for agent in self._agents
+            for method_name in agent._TRANSFER_METHODS
+        )
+
+    async def _execute_tool(self, tool_call: Dict[str, Any]) -> ToolResult:
         """Execute a tool call by finding the appropriate agent and method
 
         Returns:
-            Dict[str, Any]: Result dictionary containing success status and result/error
+            ToolResult: Success status with the tool's return value or an error
         """
         try:
             method_name = tool_call["function"]["name"]
             arguments = tool_call["function"]["arguments"]
-            args = json.loads(arguments)
-
-            for agent in self._agents:
-                if hasattr(agent, method_name):
-                    method = getattr(agent, method_name)
-                    if hasattr(method, "tool_metadata"):
-                        result = await method(**args)
-                        # Special case for agent transfers
-                        if isinstance(result, BaseAgent):
-                            return {"success": True, "result": result}
-                        return {"success": True, "result": result}
-
-            return {
-                "success": False,
-                "error": f"No agent found with tool method: {method_name}",
-            }
+            args = _EMPTY_ARGS if arguments in ("{}", "") else _parse_args(arguments)
+
+            method = self._tool_dispatch.get(method_name)
+            if method is None:
+                return ToolResult(
+                    False, None, f"No agent found with tool method: {method_name}"
+                )
+
+            # Agent transfers return the target agent as the value
+            return ToolResult(True, await method(**args), "")
 
         except Exception as e:
             error_message = f"Tool execution failed: {str(e)}"
-            self._debug_log("Tool execution error", error_message)
-            return {"success": False, "error": error_message}
+            self._debug_log("Tool execution error: %s", error_message)
+            return ToolResult(False, None, error_message)
 
-    def _debug_log(self, message: str, data: Optional[Any] = None) -> None:
-        """Log debug information if debug mode is enabled
+    async def _run_tool_calls(
+        self, tool_calls: List[Dict[str, Any]]
+    ) -> AsyncGenerator[Tuple[Dict[str, Any], ToolResult], None]:
+        """Execute tool calls in the order the model made them
+
+        Consecutive read-only tools run together; the rest may prompt the user or
+        send transactions, so they run one at a time. Each call only starts once
+        every earlier call has finished, and calls after the current one only run
+        when the next result is requested, so stopping iteration stops execution.
 
         Args:
-            message: Debug message to log
-            data: Optional data to include in debug output
+            tool_calls: The tool calls of a model response
+
+        Yields:
+            Tuple[Dict[str, Any], ToolResult]: Each tool call with its result
         """
-        if self._debug and self._logger:
-            if data:
-                self._logger.debug(f"{message}: {data}")
+        for concurrent, group in itertools.groupby(
+            tool_calls,
+            key=lambda tool_call: tool_call["function"]["name"]
+            in self._concurrent_tools,
+        ):
+            if concurrent:
+                batch = list(group)
+                results = await asyncio.gather(*map(self._execute_tool, batch))
+                for tool_call, result in zip(batch, results):
+                    yield tool_call, result
             else:
-                self._logger.debug(message)
+                for tool_call in group:
+                    yield tool_call, await self._execute_tool(tool_call)
+
+    def _debug_log(self, message: str, *args: Any) -> None:
+        """Log debug information if debug mode is enabled
+
+        Args:
+            message: Debug message to log, with %-style placeholders
+            *args: Values for the placeholders, formatted only if the message is
+                   emitted
+        """
+        if self._logger:
+            self._logger.debug(message, *args)
 
     async def process_message(self, message: str) -> str:
         """Process a user message by routing it to the appropriate agent"""
         try:
-            self._debug_log("Processing user message", message)
+            self._debug_log("Processing user message: %s", message)
             self._current_agent = self._entry_agent  # Reset agent on new message
-
             self._message_manager.add_message(message, "user")
 
-            complete_response = ""
-            message_id = shortuuid.uuid()
-            async for chunk in self.agent_loop():
-                await self._message_stream.send_partial(
-                    json.dumps(
-                        {
-                            "type": "stream",
-                            "id": message_id,
-                            "chunk": chunk,
-                        }
-                    )
-                )
-                complete_response += chunk
+            chunks: List[str] = []
+            stream_buffer = StreamBuffer(self._message_stream, new_id())
+
+            # agent_loop sends each chunk itself and yields it for the history
+            try:
+                async for chunk in self.agent_loop(stream_buffer):
+                    chunks.append(chunk)
+            finally:
+                await stream_buffer.close()
+            complete_response = "".join(chunks)
 
             # Add the complete response to message history
             self._message_manager.add_message(complete_response, "assistant")
             return complete_response
 
         except Exception as e:
-            self._debug_log("Error processing message", str(e))
+            self._debug_log("Error processing message: %s", e)
             error_msg = f"An error occurred: {str(e)}"
             await self._message_stream.send_message(
-                json.dumps({"type": "error", "error": error_msg})
+                f"{_ERROR_PREFIX}{json.dumps(error_msg)}}}"
             )
             return error_msg
 
-    async def agent_loop(self) -> AsyncGenerator[str, None]:
-        """Generate a response from the current agent"""
+    async def agent_loop(
+        self, stream_buffer: Optional[StreamBuffer] = None
+    ) -> AsyncGenerator[str, None]:
+        """Generate a response from the current agent
+
+        Args:
+            stream_buffer: Optional buffer for stream messages. When given, every
+                chunk is also sent through it, and turns of agents without tools
+                are streamed straight from the provider into it. The caller must
+                close it once the loop ends.
+        """
         generation_count = 0
         status = "streaming"
 
+        async def emit(chunk: str) -> str:
+            if stream_buffer is not None:
+                await stream_buffer.send(chunk)
+            return chunk
+
         while generation_count < 3 and status == "streaming":
             generation_count += 1
-            self._debug_log(f"Generation attempt {generation_count}")
+            self._debug_log("Generation attempt %d", generation_count)
 
             try:
+                if stream_buffer is not None and not self._current_agent._get_tools():
+                    yield await self._current_agent.stream_to(
+                        self._capabilities, stream_buffer.send
+                    )
+                    self._debug_log("Generation complete")
+                    status = "complete"
+                    break
+
                 async for chunk in self._current_agent.generate(self._capabilities):
                     if chunk == "stop":
                         self._debug_log("Generation complete")
@@ -146,46 +242,55 @@ class Runtime(ABC):
                         break
 
                     if "tool_calls" not in chunk:
-                        yield chunk["content"]
+                        yield await emit(chunk["content"])
                     else:
-                        self._debug_log("Tool calls detected", chunk)
+                        self._debug_log("Tool calls detected: %s", chunk)
+                        # Tools may send their own messages, which must follow the
+                        # text streamed so far
+                        if stream_buffer is not None:
+                            await stream_buffer.drain()
                         self._message_manager.add_message(
                             chunk["content"],
                             "assistant",
                             tool_calls=chunk["tool_calls"],
                         )
 
-                        # Process each tool call
-                        for tool_call in chunk["tool_calls"]:
-                            result = await self._execute_tool(tool_call)
-
-                            if not result["success"]:
+                        # Process each tool call, in the order the model made them,
+                        # and record the results together once all have run
+                        tool_results: List[Tuple[Any, str]] = []
+                        async for tool_call, result in self._run_tool_calls(
+                            chunk["tool_calls"]
+                        ):
+                            ok, value, error = result
+                            if not ok:
                                 # Add error to message history
-                                self._message_manager.add_message(
-                                    result["error"], "tool", tool_id=tool_call["id"]
-                                )
+                                tool_results.append((error, tool_call["id"]))
+                                self._message_manager.add_tool_results(tool_results)
                                 # Yield specific error and end loop
-                                yield "I'm sorry, something went wrong and I was unable to complete your request"
+                                yield await emit(_TOOL_FAILURE_REPLY)
                                 status = "failed"
                                 return
 
-                            if isinstance(result["result"], BaseAgent):
-                                self._current_agent = result["result"]
+                            tool_name = tool_call["function"]["name"]
+                            if tool_name in self._handoff_tools:
+                                self._current_agent = value
                                 generation_count = 0
                                 self._debug_log(
                                     "Switching to new agent, resetting generation count"
                                 )
+                                # Results of the removed tool call message go with it
                                 self._message_manager.remove_last_tool_call_message()
+                                tool_results.clear()
                             else:
-                                self._message_manager.add_message(
-                                    result["result"], "tool", tool_id=tool_call["id"]
-                                )
+                                tool_results.append((value, tool_call["id"]))
+
+                        self._message_manager.add_tool_results(tool_results)
 
             except Exception as e:
-                self._debug_log("Generation failed", str(e))
+                self._debug_log("Generation failed: %s", e)
                 status = "failed"
-                yield "I apologize, but I encountered an error"
+                yield await emit(_GENERATION_ERROR_REPLY)
                 break
 
         if status == "streaming":
-            yield "Request could not be completed. Please try again."
+            yield await emit(_INCOMPLETE_REPLY)
@@ -1,19 +1,98 @@
 from agent.core.interfaces.message_stream import MessageStream
+from typing import Optional
 import asyncio
+import codecs
+import os
 import sys
 
 
 class ConsoleStream(MessageStream):
-    async def is_connected(self) -> bool:
+    def __init__(self) -> None:
+        # Lines read from stdin by the event loop reader, registered on first use
+        self._lines: Optional[asyncio.Queue] = None
+        self._pending = ""
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        # Loop the stdin reader is registered with, until it is removed
+        self._reader_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def is_connected(self) -> bool:
         return True
 
-    async def send_message(self, message: str) -> None:
+    async def _send_raw(self, message: str) -> None:
         print(f"\n{message}")
 
     async def send_partial(self, chunk: str) -> None:
         print(chunk, end="", flush=True)
 
     async def receive_message(self) -> str:
-        # Use asyncio.get_event_loop().run_in_executor for non-blocking input
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, sys.stdin.readline)
+        """Read the next line from stdin
+
+        Returns:
+            str: The line, including its trailing newline if it has one
+
+        Raises:
+            EOFError: If stdin has reached end of input
+        """
+        if self._lines is None and not self._start_reader():
+            # Without reader support, e.g. on Windows or with a file on stdin, use
+            # a thread
+            loop = asyncio.get_running_loop()
+            line = await loop.run_in_executor(None, sys.stdin.readline)
+        else:
+            line = await self._lines.get()
+            if not line:
+                # Leave the end-of-input marker queued for any later call
+                self._lines.put_nowait(line)
+        if not line:
+            raise EOFError
+        return line
+
+    def _start_reader(self) -> bool:
+        """Register stdin with the event loop so lines are read without a thread
+
+        Returns:
+            bool: True if the reader was registered
+        """
+        fd = sys.stdin.fileno()
+        loop = asyncio.get_running_loop()
+        try:
+            loop.add_reader(fd, self._on_stdin, fd)
+        except (NotImplementedError, PermissionError):
+            # No reader support in the loop, or stdin is a regular file that
+            # cannot be polled
+            return False
+        os.set_blocking(fd, False)
+        self._reader_loop = loop
+        self._lines = asyncio.Queue()
+        return True
+
+    def close(self) -> None:
+        """Unregister the stdin reader and put stdin back into blocking mode, so the
+        terminal is left as it was found"""
+        if self._reader_loop is None:
+            return
+        fd = sys.stdin.fileno()
+        self._reader_loop.remove_reader(fd)
+        self._reader_loop = None
+        os.set_blocking(fd, True)
+
+    def _on_stdin(self, fd: int) -> None:
+        """Read the available stdin bytes and queue every complete line"""
+        try:
+            data = os.read(fd, 4096)
+        except BlockingIOError:
+            # Readiness can be reported spuriously for non-blocking fds
+            return
+        if not data:
+            # End of input, queued as an empty string like readline returns
+            self.close()
+            if self._pending:
+                self._lines.put_nowait(self._pending)
+            self._lines.put_nowait("")
+            self._pending = ""
+            return
+
+        *lines, self._pending = (self._pending + self._decoder.decode(data)).split("\n")
+        for line in lines:
+            self._lines.put_nowait(line + "\n")
@@ -0,0 +1,136 @@
+import asyncio
+import json
+from typing import List, Optional
+from agent.core.interfaces.message_stream import MessageStream
+
+# Flush once this many characters are buffered or the oldest chunk is this old
+FLUSH_CHARS = 256
+FLUSH_SECONDS = 0.005
+
+# Flushed messages waiting for the sender before producers have to wait
+SEND_QUEUE_SIZE = 64
+
+
+class StreamBuffer:
+    """Coalesces streamed text chunks into fewer stream messages
+
+    Model output arrives a few characters at a time. Sending each piece as its own
+    message costs a JSON encode and a WebSocket frame per token, so chunks are
+    joined until enough text is buffered or a few milliseconds have passed since
+    the first of them arrived, so a pause in generation never holds text back.
+    Flushed messages are written by a background sender task, so generation is
+    not held up by the socket write.
+    """
+
+    def __init__(self, message_stream: MessageStream, message_id: str) -> None:
+        """Initialize the buffer for one streamed response
+
+        Args:
+            message_stream: Stream the coalesced chunks are sent to
+            message_id: Identifier shared by every chunk of the response
+        """
+        self._message_stream = message_stream
+        # Only the chunk varies between messages, so encode the rest once
+        self._prefix = f'{{"type": "stream", "id": {json.dumps(message_id)}, "chunk": '
+        self._chunks: List[str] = []
+        self._size = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self._sender: Optional[asyncio.Task] = None
+        self._error: Optional[Exception] = None
+
+    async def send(self, chunk: str) -> None:
+        """Buffer a text chunk, sending the buffer if a flush threshold is reached
+
+        Args:
+            chunk: The text chunk to send
+
+        Raises:
+            Exception: The error of an earlier failed send, if any
+        """
+        if self._error is not None:
+            raise self._error
+        if not self._chunks:
+            self._timer = asyncio.get_running_loop().call_later(
+                FLUSH_SECONDS, self._flush_later
+            )
+        self._chunks.append(chunk)
+        self._size += len(chunk)
+        if self._size >= FLUSH_CHARS:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Queue all buffered text as a single stream message"""
+        if not self._chunks:
+            return
+        await self._queue.put(self._take())
+
+    def _flush_later(self) -> None:
+        """Queue the buffered text once the flush interval has passed. If the send
+        queue is full, try again after another interval."""
+        self._timer = None
+        if not self._chunks:
+            return
+        if self._queue.full():
+            self._timer = asyncio.get_running_loop().call_later(
+                FLUSH_SECONDS, self._flush_later
+            )
+            return
+        self._queue.put_nowait(self._take())
+
+    def _take(self) -> str:
+        """Empty the buffer and encode its text as a stream message
+
+        Returns:
+            str: The encoded stream message
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        chunk = "".join(self._chunks)
+        self._chunks.clear()
+        self._size = 0
+        if self._sender is None:
+            self._sender = asyncio.create_task(self._send_loop())
+        return f"{self._prefix}{json.dumps(chunk)}}}"
+
+    async def drain(self) -> None:
+        """Flush the buffer and wait until every queued message has been sent
+
+        Raises:
+            Exception: The error of a failed send, if any
+        """
+        await self.flush()
+        await self._queue.join()
+        if self._error is not None:
+            raise self._error
+
+    async def close(self) -> None:
+        """Drain the buffer and stop the sender task
+
+        Raises:
+            Exception: The error of a failed send, if any
+        """
+        try:
+            await self.drain()
+        finally:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._sender is not None:
+                self._sender.cancel()
+                self._sender = None
+
+    async def _send_loop(self) -> None:
+        """Write queued messages to the stream in order"""
+        while True:
+            message = await self._queue.get()
+            try:
+                # After a failure keep consuming so drain does not wait forever
+                if self._error is None:
+                    await self._message_stream.send_partial(message)
+            except Exception as e:
+                self._error = e
+            finally:
+                self._queue.task_done()
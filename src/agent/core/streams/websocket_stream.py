@@ -1,6 +1,8 @@
-import uuid
-from typing import Optional
+import asyncio
+from collections import deque
+from typing import Deque, Optional
 from agent.core.interfaces.message_stream import MessageStream
+from utils.ids import new_id
 from fastapi import WebSocket, WebSocketDisconnect
 from fastapi.websockets import WebSocketState
 
@@ -8,23 +10,29 @@ from fastapi.websockets import WebSocketState
 class WebSocketStream(MessageStream):
     def __init__(self, websocket: WebSocket):
         self._websocket = websocket
-        self._id = str(uuid.uuid4())
+        self._id = new_id()
 
-    async def is_connected(self) -> bool:
+        # Frames read ahead by the reader task, handed out in arrival order
+        self._inbox: Deque[str] = deque()
+        self._waiter: Optional[asyncio.Future] = None
+        self._reader: Optional[asyncio.Task] = None
+        self._receive_error: Optional[Exception] = None
+
+    @property
+    def is_connected(self) -> bool:
         return self._websocket.client_state == WebSocketState.CONNECTED
 
-    async def send_message(self, message: str) -> None:
-        if await self.is_connected():
-            await self._websocket.send_text(message)
+    async def _send_raw(self, message: str) -> None:
+        await self._websocket.send_text(message)
 
     async def send_partial(self, chunk: str) -> None:
         await self._websocket.send_text(chunk)
 
     async def receive_message(self) -> str:
         try:
-            return await self._websocket.receive_text()
+            return await self._next_text()
         except Exception as e:
-            if not await self.is_connected():
+            if not self.is_connected:
                 raise WebSocketDisconnect() from e
             raise
 
@@ -38,14 +46,59 @@ class WebSocketStream(MessageStream):
         Raises:
             WebSocketDisconnect: If the connection is closed while waiting
         """
-        if not await self.is_connected():
+        if not self.is_connected and not self._inbox:
             raise WebSocketDisconnect("Connection is already closed")
 
         try:
-            return await self._websocket.receive_text()
+            return await self._next_text()
         except Exception as e:
-            if not await self.is_connected():
+            if not self.is_connected:
                 raise WebSocketDisconnect(
                     "Connection closed while waiting for response"
                 ) from e
             raise
+
+    async def close(self) -> None:
+        """Stop the reader task; call once the connection is no longer used"""
+        if self._reader is None:
+            return
+        self._reader.cancel()
+        try:
+            await self._reader
+        except asyncio.CancelledError:
+            pass
+        self._reader = None
+
+    async def _next_text(self) -> str:
+        """Return the next received frame, waiting for the reader task if none is
+        queued. Frames that arrived together are returned without waking the reader.
+
+        Raises:
+            Exception: The error that stopped the reader, once the queue is empty
+        """
+        if self._reader is None:
+            self._reader = asyncio.create_task(self._read_loop())
+        while not self._inbox:
+            if self._receive_error is not None:
+                raise self._receive_error
+            self._waiter = asyncio.get_running_loop().create_future()
+            try:
+                await self._waiter
+            finally:
+                self._waiter = None
+        return self._inbox.popleft()
+
+    async def _read_loop(self) -> None:
+        """Read frames from the socket into the queue until receiving fails"""
+        try:
+            while True:
+                self._inbox.append(await self._websocket.receive_text())
+                self._wake()
+        except Exception as e:
+            self._receive_error = e
+            self._wake()
+
+    def _wake(self) -> None:
+        """Resume the consumer waiting for a frame, if any"""
+        if self._waiter is not None and not self._waiter.done():
+            self._waiter.set_result(None)
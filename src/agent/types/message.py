@@ -0,0 +1,39 @@
+"""Conversation message type definitions."""
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"))
+
+
+@dataclass(slots=True)
+class Message:
+    """Represents a message in the conversation history."""
+
+    content: Optional[str]
+    role: str
+    tool_calls: Optional[List[Dict]] = None
+    tool_call_id: Optional[str] = None
+    timestamp: Optional[float] = None
+    _json: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the message to the provider's dictionary format."""
+        return {
+            "content": self.content,
+            "role": self.role,
+            "tool_calls": self.tool_calls,
+            "tool_call_id": self.tool_call_id,
+            "timestamp": self.timestamp,
+        }
+
+    def to_json(self) -> str:
+        """Encode the message as compact JSON with sorted keys.
+
+        Messages are not modified once added to the history, so the encoding is
+        computed once and reused for every later request.
+        """
+        if self._json is None:
+            self._json = _ENCODER.encode(self.to_dict())
+        return self._json
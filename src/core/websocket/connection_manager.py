@@ -1,21 +1,33 @@
 """Connection manager for WebSocket connections."""
 
-from typing import Dict, Set, Any, Callable, TypeVar
+from typing import Dict, Any, Callable, Hashable, List, Optional, TypeVar
 import asyncio
 from fastapi import WebSocket
 import json
+import logging
 from dataclasses import dataclass
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
 
-@dataclass(eq=True, frozen=True)
+# Same compact encoding as WebSocket.send_json, built once instead of per call
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+
+@dataclass(eq=False, slots=True)
 class WebSocketConnection:
     """Represents a websocket connection with associated metadata"""
 
     socket: WebSocket
     metadata: Any = None
 
+    def __eq__(self, other: object) -> bool:
+        """Connections are equal when they wrap the same WebSocket object"""
+        if not isinstance(other, WebSocketConnection):
+            return NotImplemented
+        return other.socket is self.socket
+
     def __hash__(self) -> int:
         """Define custom hash based on the WebSocket object's id"""
         return id(self.socket)
@@ -24,15 +36,28 @@ class WebSocketConnection:
 class ConnectionManager:
     """Manages WebSocket connections and implements connection limits and heartbeats."""
 
-    def __init__(self, max_connections: int = 1000):
+    def __init__(
+        self,
+        max_connections: int = 1000,
+        channel_key: Optional[Callable[[Any], Hashable]] = None,
+    ):
         """
         Initialize the connection manager.
 
         Args:
             max_connections: Maximum number of concurrent connections allowed
+            channel_key: Function that maps connection metadata to the channel the
+                        connection is indexed under for broadcast_to_channel, or None
+                        to leave the connection out of every channel
         """
-        self.active_connections: Set[WebSocketConnection] = set()
+        # Keyed by id() of the socket so connections are removed in constant time
+        self.active_connections: Dict[int, WebSocketConnection] = {}
         self.max_connections = max_connections
+        self._channel_key = channel_key
+        # Active connections plus those still being accepted, so concurrent connects
+        # cannot pass the limit while awaiting accept()
+        self._connection_count = 0
+        self._channels: Dict[Hashable, Dict[int, WebSocketConnection]] = {}
 
     async def connect(self, websocket: WebSocket, metadata: Any = None) -> bool:
         """
@@ -45,17 +70,22 @@ class ConnectionManager:
         Returns:
             bool: True if connection was accepted, False if rejected
         """
-        if len(self.active_connections) >= self.max_connections:
+        if self._connection_count >= self.max_connections:
             await websocket.close(code=1008)  # Connection limit exceeded
             return False
 
+        self._connection_count += 1
         try:
             await websocket.accept()
             connection = WebSocketConnection(socket=websocket, metadata=metadata)
-            self.active_connections.add(connection)
+            self.active_connections[id(websocket)] = connection
+            channel = self._get_channel(metadata)
+            if channel is not None:
+                self._channels.setdefault(channel, {})[id(websocket)] = connection
             return True
         except Exception as e:
-            print(f"Failed to establish websocket connection: {e}")
+            self._connection_count -= 1
+            logger.warning("Failed to establish websocket connection: %s", e)
             return False
 
     def disconnect(self, websocket: WebSocket):
@@ -65,9 +95,22 @@ class ConnectionManager:
         Args:
             websocket: The WebSocket connection to remove
         """
-        self.active_connections = {
-            conn for conn in self.active_connections if conn.socket != websocket
-        }
+        connection = self.active_connections.pop(id(websocket), None)
+        if connection is None:
+            return
+        self._connection_count -= 1
+        channel = self._get_channel(connection.metadata)
+        members = self._channels.get(channel)
+        if members is not None:
+            members.pop(id(websocket), None)
+            if not members:
+                del self._channels[channel]
+
+    def _get_channel(self, metadata: Any) -> Optional[Hashable]:
+        """Return the channel a connection with the given metadata belongs to"""
+        if self._channel_key is None:
+            return None
+        return self._channel_key(metadata)
 
     async def broadcast_filtered(
         self, message: dict, predicate: Callable[[Any], bool]
@@ -80,9 +123,44 @@ class ConnectionManager:
             predicate: Function that takes connection metadata and returns True if the connection
                       should receive the message
         """
-        for connection in self.active_connections:
-            if predicate(connection.metadata):
-                try:
-                    await connection.socket.send_json(message)
-                except Exception as e:
-                    print(f"Failed to send message to websocket: {e}")
+        await self._send_all(
+            [
+                connection
+                for connection in self.active_connections.values()
+                if predicate(connection.metadata)
+            ],
+            message,
+        )
+
+    async def broadcast_to_channel(self, channel: Hashable, message: dict) -> None:
+        """
+        Broadcast a message to all connections indexed under a channel.
+
+        Args:
+            channel: The channel, as returned by the manager's channel_key
+            message: The message to broadcast
+        """
+        members = self._channels.get(channel)
+        if members:
+            await self._send_all(list(members.values()), message)
+
+    async def _send_all(
+        self, connections: List[WebSocketConnection], message: dict
+    ) -> None:
+        """
+        Send a message to the given connections concurrently.
+
+        Args:
+            connections: The connections to send to
+            message: The message to send
+        """
+        # Encode once, as send_json would, and send to every recipient concurrently
+        # so a slow client does not hold up the others
+        payload = _JSON_ENCODER.encode(message)
+        results = await asyncio.gather(
+            *(connection.socket.send_text(payload) for connection in connections),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.debug("Failed to send message to websocket: %s", result)
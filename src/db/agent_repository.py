@@ -1,10 +1,37 @@
 """Repository for agent-related database operations."""
 
-from typing import Optional
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from psycopg2.extensions import connection
 
 from agent.types.agent_info import AgentInfo
 from .connection import DatabaseConnection
 
+# Server-side prepared statement for fetch_agent, so the query is parsed and
+# planned once per pooled connection instead of on every lookup
+_FETCH_AGENT_STATEMENT = """
+    PREPARE fetch_agent AS
+    SELECT a.id, m.user_id, a.wallet_id, a.name, a.wallet_address
+    FROM agents a
+    JOIN user_agent_mapping m ON a.id = m.agent_id
+    WHERE a.id = $1
+"""
+
+# Connections the statement has been prepared on; it lasts as long as the session
+_prepared_connections: "weakref.WeakSet[connection]" = weakref.WeakSet()
+
+AGENT_CACHE_SIZE = 1024
+AGENT_CACHE_TTL_SECONDS = 30  # Bounds how long renamed or reassigned agents are stale
+
+# Agents found by fetch_agent, shared by all repositories. Lookups run in worker
+# threads, so access is guarded by a lock.
+_agent_cache: "OrderedDict[str, Tuple[float, AgentInfo]]" = OrderedDict()
+_agent_cache_lock = threading.Lock()
+
 
 class AgentRepository:
     """Handles database operations related to agents."""
@@ -20,7 +47,8 @@ class AgentRepository:
 
     def fetch_agent(self, agent_id: str) -> Optional[AgentInfo]:
         """
-        Fetch agent data from the database.
+        Fetch agent data from the database. Found agents are cached for a few
+        seconds; missing agents are always looked up again.
 
         Args:
             agent_id: The unique identifier of the agent
@@ -31,24 +59,33 @@ class AgentRepository:
         Raises:
             DatabaseConnectionError: If database connection fails
         """
-        query = """
-            SELECT a.id, m.user_id, a.wallet_id, a.name, a.wallet_address
-            FROM agents a
-            JOIN user_agent_mapping m ON a.id = m.agent_id
-            WHERE a.id = %s
-        """
+        with _agent_cache_lock:
+            cached = _agent_cache.get(agent_id)
+            if cached is not None and cached[0] > time.monotonic():
+                _agent_cache.move_to_end(agent_id)
+                return cached[1]
 
         with self._db.get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(query, (agent_id,))
+                if conn not in _prepared_connections:
+                    cur.execute(_FETCH_AGENT_STATEMENT)
+                    _prepared_connections.add(conn)
+                cur.execute("EXECUTE fetch_agent(%s)", (agent_id,))
                 result = cur.fetchone()
 
-                if result:
-                    return AgentInfo(
-                        id=result[0],
-                        user_id=result[1],
-                        wallet_id=result[2],
-                        name=result[3],
-                        wallet_address=result[4],
-                    )
-                return None
+                if not result:
+                    return None
+
+        agent = AgentInfo(
+            id=result[0],
+            user_id=result[1],
+            wallet_id=result[2],
+            name=result[3],
+            wallet_address=result[4],
+        )
+        with _agent_cache_lock:
+            _agent_cache[agent_id] = (time.monotonic() + AGENT_CACHE_TTL_SECONDS, agent)
+            _agent_cache.move_to_end(agent_id)
+            if len(_agent_cache) > AGENT_CACHE_SIZE:
+                _agent_cache.popitem(last=False)
+        return agent
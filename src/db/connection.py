@@ -4,7 +4,7 @@ from typing import Optional, Generator
 import os
 from contextlib import contextmanager
 import psycopg2
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.pool import ThreadedConnectionPool
 from psycopg2.extensions import connection
 from .exceptions import DatabaseConnectionError, DatabaseConfigError
 
@@ -14,7 +14,7 @@ class DatabaseConnection:
 
     def __init__(self) -> None:
         """Initialize the database connection manager."""
-        self._pool: Optional[SimpleConnectionPool] = None
+        self._pool: Optional[ThreadedConnectionPool] = None
         self._initialize_pool()
 
     def _initialize_pool(self) -> None:
@@ -26,7 +26,9 @@ class DatabaseConnection:
                     "DATABASE_URL environment variable is not set"
                 )
 
-            self._pool = SimpleConnectionPool(minconn=1, maxconn=10, dsn=db_url)
+            # Queries run in worker threads off the event loop, so the pool must be
+            # safe to share between threads
+            self._pool = ThreadedConnectionPool(minconn=1, maxconn=10, dsn=db_url)
         except psycopg2.Error as e:
             raise DatabaseConnectionError(
                 f"Failed to initialize database pool: {str(e)}"
@@ -46,6 +48,7 @@ class DatabaseConnection:
         if not self._pool:
             raise DatabaseConnectionError("Connection pool not initialized")
 
+        connection = None
         try:
             connection = self._pool.getconn()
             yield connection
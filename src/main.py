@@ -1,16 +1,18 @@
 import asyncio
 import argparse
-import tracemalloc
+import hashlib
+import time
 from typing import Optional
 from google.oauth2 import id_token
 from google.auth.transport import requests
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request
 from fastapi.websockets import WebSocketState
 from agent.agents.conversational_agent import ConversationalAgent
-from agent.agents.intro_agent import IntroAgent
+from agent.agents.intro_agent import IntroAgent, close_http_client
 from agent.agents.routing_agent import RoutingAgent
 from agent.agents.wallet_agent import WalletAgent
 from agent.core.memory.message_manager import MessageManager
+from agent.core.providers.open_ai import OpenAIProvider
 from agent.core.runtime import Runtime
 from agent.core.streams.websocket_stream import WebSocketStream
 from agent.core.streams.console_stream import ConsoleStream
@@ -23,17 +25,47 @@ from core.websocket.connection_manager import ConnectionManager
 import os
 from dotenv import load_dotenv
 import aiohttp
+import uvicorn
+import logging
+import logging.handlers
+import queue
 from db.agent_repository import AgentRepository
 from db.connection import DatabaseConnection
 from contextlib import asynccontextmanager
-from utils.privy_auth import PrivyAuthorizationSigner
-from typing import Dict, Any
+from utils.privy_auth import (
+    PrivyAuthorizationSigner,
+    close_http_session as close_privy_http_session,
+)
+from typing import Dict, Any, Tuple
+from collections import OrderedDict
+
+try:
+    import uvloop
+except ImportError:  # Optional; the default asyncio event loop is used without it
+    uvloop = None
 
 # Load environment variables
 load_dotenv(override=True)
 
 API_URL = os.getenv("ZOS_USER_API_URL")
 
+logger = logging.getLogger(__name__)
+
+TOKEN_CACHE_SIZE = 10000
+TOKEN_CACHE_TTL_SECONDS = 60  # Bounds how long a revoked token keeps working
+
+# Users of recently verified access tokens, keyed by a digest of the token, and
+# verifications in flight
+_token_cache: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+_token_requests: "Dict[bytes, asyncio.Task[Optional[dict]]]" = {}
+
+# Soft open file limit used when the hard limit is unlimited
+OPEN_FILE_LIMIT = 65536
+
+# Wallets reused across connections to the same agent, least recently used first
+WALLET_CACHE_SIZE = 256
+_wallets: "OrderedDict[Tuple[str, str, str], ZWallet]" = OrderedDict()
+
 
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
@@ -47,6 +79,15 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--port", type=int, default=8000, help="Port for web server mode"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Worker processes for web server mode. Wallet event webhooks only reach "
+            "connections held by the worker that receives them"
+        ),
+    )
     return parser.parse_args()
 
 
@@ -57,19 +98,111 @@ def initialize_wallet(agent_data: AgentInfo) -> ZWallet:
     return wallet
 
 
+def get_wallet(agent_data: AgentInfo) -> ZWallet:
+    """Return the agent's wallet, reusing the one built for an earlier connection.
+    Wallets hold no conversation state, so connections to one agent can share it.
+
+    Args:
+        agent_data: The agent the wallet belongs to
+
+    Returns:
+        ZWallet: The wallet with its adapters registered
+    """
+    key = (agent_data.id, agent_data.wallet_id, agent_data.wallet_address)
+    wallet = _wallets.get(key)
+    if wallet is not None:
+        _wallets.move_to_end(key)
+        return wallet
+
+    wallet = _wallets[key] = initialize_wallet(agent_data)
+    if len(_wallets) > WALLET_CACHE_SIZE:
+        _wallets.popitem(last=False)
+    return wallet
+
+
+def raise_open_file_limit() -> None:
+    """Raise the soft open file limit to the hard limit. Each websocket holds a
+    file descriptor, and the common default of 1024 leaves no headroom above the
+    connection limit."""
+    try:
+        import resource
+    except ImportError:  # Not available on Windows
+        return
+
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    # macOS reports an unlimited hard limit but rejects it as a soft limit
+    target = OPEN_FILE_LIMIT if hard == resource.RLIM_INFINITY else hard
+    if soft == resource.RLIM_INFINITY or soft >= target:
+        return
+    try:
+        resource.setrlimit(resource.RLIMIT_NOFILE, (target, hard))
+    except (ValueError, OSError) as e:
+        logger.warning("Could not raise the open file limit to %s: %s", target, e)
+
+
+def start_log_listener(
+    debug: bool,
+) -> Tuple[logging.handlers.QueueListener, logging.handlers.QueueHandler]:
+    """Send log records through a queue that a background thread writes out, so
+    logging from request handlers never blocks the event loop on stderr.
+
+    Args:
+        debug: Log at debug level if True
+
+    Returns:
+        Tuple[logging.handlers.QueueListener, logging.handlers.QueueHandler]: The
+            started listener and the handler added to the root logger, to stop and
+            remove on shutdown
+    """
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+
+    root = logging.getLogger()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    root.addHandler(queue_handler)
+    root.setLevel(logging.DEBUG if debug else logging.WARNING)
+
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener, queue_handler
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Manage database connection lifecycle."""
+    """Manage database connection and shared HTTP client lifecycle."""
+    # Worker processes import the app afresh and get settings from the environment
+    if not hasattr(app.state, "debug"):
+        app.state.debug = os.getenv("AGENT_DEBUG") == "1"
+    log_listener, log_handler = start_log_listener(app.state.debug)
     app.state.db_connection = DatabaseConnection()
+    # One provider shared by every agent and connection
+    app.state.model_provider = OpenAIProvider(debug=app.state.debug)
+    # Keep-alive connections to the user API for access token checks
+    app.state.http_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=200, ttl_dns_cache=300, keepalive_timeout=60
+        )
+    )
     yield
     if hasattr(app.state, "db_connection"):
         app.state.db_connection.close()
+    await close_http_client()
+    await close_privy_http_session()
+    await app.state.model_provider.aclose()
+    await app.state.http_session.close()
+    # Remove the handler first so no record is queued after the listener stops
+    logging.getLogger().removeHandler(log_handler)
+    log_listener.stop()
 
 
 app = FastAPI(lifespan=lifespan)
 
-# Initialize connection manager
-connection_manager = ConnectionManager()
+# Initialize connection manager, indexing connections by their agent's wallet for
+# wallet event broadcasts
+connection_manager = ConnectionManager(
+    channel_key=lambda metadata: getattr(metadata, "wallet_id", None)
+)
 
 # Initialize Privy signer
 privy_signer = PrivyAuthorizationSigner()
@@ -78,8 +211,38 @@ privy_signer = PrivyAuthorizationSigner()
 async def verify_access_token(token: str) -> Optional[dict]:
     """
     Verify the access token by checking against the users/current endpoint.
+    Valid tokens are cached briefly, and concurrent checks of the same token share
+    one request.
+
+    Args:
+        token: The access token
+
+    Returns:
+        dict: User information if token is valid
+        None: If token is invalid
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        _token_cache.move_to_end(key)
+        return cached[1]
+
+    request = _token_requests.get(key)
+    if request is None:
+        request = _token_requests[key] = asyncio.create_task(
+            _fetch_user_info(key, token)
+        )
+        request.add_done_callback(lambda _: _token_requests.pop(key, None))
+    # Shielded so a client disconnecting does not cancel the request for others
+    return await asyncio.shield(request)
+
+
+async def _fetch_user_info(key: bytes, token: str) -> Optional[dict]:
+    """
+    Fetch the user for an access token and cache it if the token is valid.
 
     Args:
+        key: The token's cache key
         token: The access token
 
     Returns:
@@ -89,18 +252,25 @@ async def verify_access_token(token: str) -> Optional[dict]:
     try:
         headers = {"Authorization": f"Bearer {token}"}
 
-        async with aiohttp.ClientSession() as session:
-            async with session.get(API_URL, headers=headers) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    print(f"Token verification failed with status: {response.status}")
-                    return None
+        async with app.state.http_session.get(API_URL, headers=headers) as response:
+            if response.status == 200:
+                user_info = await response.json()
+            else:
+                logger.warning(
+                    "Token verification failed with status: %s", response.status
+                )
+                return None
 
     except Exception as e:
-        print(f"Token verification failed: {str(e)}")
+        logger.warning("Token verification failed: %s", e)
         return None
 
+    _token_cache[key] = (time.monotonic() + TOKEN_CACHE_TTL_SECONDS, user_info)
+    _token_cache.move_to_end(key)
+    if len(_token_cache) > TOKEN_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+    return user_info
+
 
 @app.websocket("/chat")
 async def websocket_endpoint(websocket: WebSocket):
@@ -121,7 +291,7 @@ async def websocket_endpoint(websocket: WebSocket):
         return
 
     agent_repo = AgentRepository(app.state.db_connection)
-    agent_data = agent_repo.fetch_agent(agent_id)
+    agent_data = await asyncio.to_thread(agent_repo.fetch_agent, agent_id)
 
     if not agent_data or agent_data.user_id != user_info.get("id"):
         await websocket.close(code=4003, reason="Invalid agent access")
@@ -131,21 +301,18 @@ async def websocket_endpoint(websocket: WebSocket):
     if not await connection_manager.connect(websocket, metadata=agent_data):
         return
 
-    # Start memory tracking
-    tracemalloc.start()
-    snapshot_start = tracemalloc.take_snapshot()
-
     # Add user info to the websocket state
     websocket.state.user = user_info
 
     # Initialize components
-    wallet = initialize_wallet(agent_data)
+    wallet = get_wallet(agent_data)
     stream = WebSocketStream(websocket)
     message_manager = MessageManager()
 
     # Initialize all agents with agent data
     wallet_agent = WalletAgent(
         wallet=wallet,
+        model_provider=app.state.model_provider,
         message_manager=message_manager,
         message_stream=stream,
         debug=app.state.debug,
@@ -153,6 +320,7 @@ async def websocket_endpoint(websocket: WebSocket):
     )
     conversational_agent = ConversationalAgent(
         agent_name=agent_data.name,
+        model_provider=app.state.model_provider,
         message_manager=message_manager,
         message_stream=stream,
         debug=app.state.debug,
@@ -161,6 +329,7 @@ async def websocket_endpoint(websocket: WebSocket):
 
     routing_agent = RoutingAgent(
         agents=agents,
+        model_provider=app.state.model_provider,
         message_manager=message_manager,
         message_stream=stream,
         debug=app.state.debug,
@@ -180,13 +349,8 @@ async def websocket_endpoint(websocket: WebSocket):
             message = await stream.receive_message()
             await runtime.process_message(message)
 
-            # Take memory snapshot and log usage
-            snapshot = tracemalloc.take_snapshot()
-            top_stats = snapshot.compare_to(snapshot_start, "lineno")
-            print(f"Memory usage: {top_stats[0].size / 1024 / 1024:.2f} MB")
-
     except WebSocketDisconnect:
-        print("Client disconnected")
+        logger.debug("Client disconnected")
     except Exception as e:
         if websocket.client_state != WebSocketState.DISCONNECTED:
             try:
@@ -195,25 +359,28 @@ async def websocket_endpoint(websocket: WebSocket):
                 pass
     finally:
         connection_manager.disconnect(websocket)
+        await stream.close()
         # Only attempt to close if the connection is still open
         try:
             if websocket.client_state != WebSocketState.DISCONNECTED:
                 await websocket.close()
         except:
             pass
-        tracemalloc.stop()
 
 
 async def chat_loop(runtime: Runtime, stream: ConsoleStream) -> None:
     """Run the chat loop for console interaction"""
-    while True:
-        try:
-            message = await stream.receive_message()
-            await runtime.process_message(message)
-        except (KeyboardInterrupt, EOFError):
-            break
-        except Exception as e:
-            await stream.send_message(f"Error: {str(e)}")
+    try:
+        while True:
+            try:
+                message = await stream.receive_message()
+                await runtime.process_message(message)
+            except (KeyboardInterrupt, EOFError):
+                break
+            except Exception as e:
+                await stream.send_message(f"Error: {str(e)}")
+    finally:
+        stream.close()
 
 
 @app.post("/webhook/wallet-events")
@@ -223,15 +390,8 @@ async def wallet_events_webhook(event: WebhookEvent):
         type = "funds_received" if event.amount_received else "funds_sent"
         message = {"type": type, "data": event.model_dump()}
 
-        # Broadcast to connections where the agent's wallet_id matches the event
-        await connection_manager.broadcast_filtered(
-            message,
-            predicate=lambda metadata: (
-                metadata is not None
-                and hasattr(metadata, "wallet_id")
-                and metadata.wallet_id == event.wallet_id
-            ),
-        )
+        # Broadcast to connections whose agent's wallet_id matches the event
+        await connection_manager.broadcast_to_channel(event.wallet_id, message)
 
         return {"status": "success"}
     except Exception as e:
@@ -251,7 +411,7 @@ async def sign_wallet_payload(request: Request) -> Dict[str, str]:
     """
     try:
         payload = await request.json()
-        signature = privy_signer.get_auth_signature(payload)
+        signature = await privy_signer.get_auth_signature(payload)
         return {"signature": signature}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -261,17 +421,31 @@ def main() -> None:
     args = parse_args()
 
     if args.web:
-        import uvicorn
-
         app.state.debug = args.debug
-        uvicorn.run(app, host="0.0.0.0", port=args.port)
+        os.environ["AGENT_DEBUG"] = "1" if args.debug else "0"
+        raise_open_file_limit()
+        uvicorn.run(
+            # Multiple workers need an import string to load the app in each process
+            "main:app" if args.workers > 1 else app,
+            workers=args.workers,
+            host="0.0.0.0",
+            port=args.port,
+            # Chat frames are small JSON messages; compression costs more CPU and
+            # per-connection memory than it saves, and without it each connection is
+            # small enough for the connection manager's limit to be reached
+            ws_per_message_deflate=False,
+            # Size the accept queue and request cap to the websocket limit
+            backlog=2048,
+            limit_concurrency=connection_manager.max_connections * 2,
+        )
     else:
         wallet = initialize_wallet(args.debug)
         stream = ConsoleStream()
         runtime = Runtime(wallet=wallet, message_stream=stream, debug=args.debug)
 
         clear_screen()
-        asyncio.run(chat_loop(runtime, stream))
+        run = uvloop.run if uvloop else asyncio.run
+        run(chat_loop(runtime, stream))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,27 @@
+from collections import deque
+from typing import Deque
+import base64
+import os
+
+# Number of 16-byte ids drawn from the OS random source per refill
+ID_POOL_SIZE = 1024
+
+_id_pool: Deque[bytes] = deque()
+
+
+def _refill_ids() -> None:
+    """Refill the id pool with a single read from the OS random source"""
+    buf = os.urandom(16 * ID_POOL_SIZE)
+    _id_pool.extend(buf[i : i + 16] for i in range(0, len(buf), 16))
+
+
+def new_id() -> str:
+    """
+    Generate a random 128-bit identifier
+
+    Returns:
+        str: 22 character URL-safe base64 identifier
+    """
+    if not _id_pool:
+        _refill_ids()
+    return base64.urlsafe_b64encode(_id_pool.popleft()).rstrip(b"=").decode()
@@ -1,4 +1,5 @@
-from typing import Dict, Type, Any
+from types import MappingProxyType
+from typing import Dict, Mapping, Type, Any
 from wallet.adapters.base_adapter import BaseAdapter
 from wallet.exceptions import AdapterError
 
@@ -7,6 +8,10 @@ class AdapterRegistry:
     
     def __init__(self):
         self._adapters: Dict[str, BaseAdapter] = {}
+        # Read-only live view handed out by list_adapters, so callers get no copy
+        self._adapters_view: Mapping[str, BaseAdapter] = MappingProxyType(
+            self._adapters
+        )
         
     def register(self, adapter: BaseAdapter) -> None:
         """Register a new adapter instance"""
@@ -21,6 +26,6 @@ class AdapterRegistry:
             raise AdapterError(f"No adapter found for namespace '{namespace}'")
         return self._adapters[namespace]
     
-    def list_adapters(self) -> Dict[str, BaseAdapter]:
-        """Return all registered adapters"""
-        return self._adapters.copy() 
\ No newline at end of file
+    def list_adapters(self) -> Mapping[str, BaseAdapter]:
+        """Return a read-only view of all registered adapters; use register to add"""
+        return self._adapters_view 
\ No newline at end of file
@@ -17,10 +17,12 @@ class MethodDescriptor:
 class BaseAdapter(ABC):
     """Base class for all wallet adapters"""
 
+    # The namespace for this adapter, derived from the class name when defined
+    namespace: str = "base"
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.namespace = cls.__name__.lower().replace("adapter", "")
+
     def __init__(self, wallet: WalletType):
         self._wallet = wallet
-
-    @property
-    def namespace(self) -> str:
-        """Return the namespace for this adapter"""
-        return self.__class__.__name__.lower().replace("adapter", "")
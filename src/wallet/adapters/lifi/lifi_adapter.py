@@ -1,11 +1,21 @@
+from collections import OrderedDict
 from decimal import Decimal
-from typing import Dict, Any, AsyncGenerator
+from typing import Dict, Any, AsyncGenerator, Tuple
+import time
 import requests
 from wallet.adapters.base_adapter import BaseAdapter
 from wallet.wallet_types import WalletType
 from wallet.exceptions import QuoteError
 from .types import TokenInfo
 
+TOKEN_INFO_CACHE_SIZE = 1024
+TOKEN_INFO_TTL_SECONDS = 300  # Bounds staleness of the included priceUSD
+
+# Token metadata rarely changes, so it is shared across wallets and sessions
+_token_info_cache: "OrderedDict[Tuple[int, str], Tuple[float, TokenInfo]]" = (
+    OrderedDict()
+)
+
 
 class LiFiAdapter(BaseAdapter):
     """Adapter for LiFi endpoints"""
@@ -17,10 +27,12 @@ class LiFiAdapter(BaseAdapter):
 
     def get_token_info(self, chain_id: int, token_address: str) -> TokenInfo:
         """
-        Get token information from LiFi API
+        Get token information from LiFi API. Results are cached for a few minutes
+        per chain and case-insensitive token address or symbol.
 
         Args:
-            token_address: Address of the token
+            chain_id: Chain ID the token lives on
+            token_address: Address or symbol of the token
 
         Returns:
             TokenInfo containing token information including decimals
@@ -28,6 +40,12 @@ class LiFiAdapter(BaseAdapter):
         Raises:
             QuoteError: If token info request fails
         """
+        cache_key = (chain_id, token_address.lower())
+        cached = _token_info_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            _token_info_cache.move_to_end(cache_key)
+            return cached[1]
+
         params = {
             "chain": chain_id,
             "token": token_address,
@@ -41,11 +59,19 @@ class LiFiAdapter(BaseAdapter):
             if "decimals" not in token_data:
                 raise QuoteError(f"Invalid token info response for {token_address}")
 
-            return TokenInfo(**token_data)
-
+            token_info = TokenInfo(**token_data)
         except requests.exceptions.RequestException as e:
             raise QuoteError(f"Failed to get token info: {str(e)}")
 
+        _token_info_cache[cache_key] = (
+            time.monotonic() + TOKEN_INFO_TTL_SECONDS,
+            token_info,
+        )
+        _token_info_cache.move_to_end(cache_key)
+        if len(_token_info_cache) > TOKEN_INFO_CACHE_SIZE:
+            _token_info_cache.popitem(last=False)
+        return token_info
+
     def get_quote(
         self,
         chain_id: int,
@@ -122,9 +148,7 @@ class LiFiAdapter(BaseAdapter):
             "transaction_hash": tx_hash,
         }
 
-        receipt = await self._wallet._web3.eth.wait_for_transaction_receipt(
-            tx_hash, poll_latency=0.5
-        )
+        receipt = await self._wallet.wait_for_receipt(tx_hash)
 
         yield {
             "status": "success" if receipt["status"] == 1 else "failed",
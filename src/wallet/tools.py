@@ -1,5 +1,5 @@
 from typing import Callable, Dict, Any, Optional, NamedTuple
-from functools import wraps
+from functools import lru_cache, wraps
 import inspect
 from decimal import Decimal
 
@@ -11,6 +11,12 @@ class ToolMetadata(NamedTuple):
     namespace: Optional[str]  # The namespace for routing
 
 
+@lru_cache(maxsize=None)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    """Get the signature of a tool function, computed once per function"""
+    return inspect.signature(func)
+
+
 def create_tool(
     func: Callable,
     descriptions: Dict[str, str] = None,
@@ -23,7 +29,7 @@ def create_tool(
         descriptions: Optional dictionary mapping parameter names to their descriptions
         namespace: Optional namespace for routing
     """
-    sig = inspect.signature(func)
+    sig = _cached_signature(func)
     doc = inspect.getdoc(func) or ""
     descriptions = descriptions or {}
 
@@ -90,13 +96,17 @@ def wallet_tool(
     """
 
     def decorator(func: Callable) -> Callable:
+        decimal_params = frozenset(
+            param_name
+            for param_name, param in _cached_signature(func).parameters.items()
+            if param.annotation is Decimal
+        )
+
         @wraps(func)
         async def wrapper(self, **kwargs):
             # Convert string amounts to Decimal where needed
-            sig = inspect.signature(func)
-            for param_name, param in sig.parameters.items():
-                if param.annotation == Decimal and param_name in kwargs:
-                    kwargs[param_name] = Decimal(kwargs[param_name])
+            for param_name in decimal_params & kwargs.keys():
+                kwargs[param_name] = Decimal(kwargs[param_name])
             return await func(self, **kwargs)
 
         # Store tool metadata
@@ -4,6 +4,7 @@ import os
 from typing import List, Optional, Dict, Any, Set, AsyncGenerator
 from eth_account import Account
 from web3 import AsyncWeb3
+from web3.exceptions import TimeExhausted, TransactionNotFound
 from decimal import Decimal
 from agent.types.agent_info import AgentInfo
 from wallet.exceptions import (
@@ -212,6 +213,43 @@ class ZWallet:
 
                 return await response.json()
 
+    async def wait_for_receipt(
+        self,
+        tx_hash: str,
+        timeout: float = 120,
+        initial_delay: float = 0.25,
+        max_delay: float = 4.0,
+    ) -> Dict[str, Any]:
+        """
+        Wait for a transaction receipt, polling with exponential backoff.
+
+        Args:
+            tx_hash (str): Hash of the submitted transaction
+            timeout (float): Seconds to wait before giving up
+            initial_delay (float): Delay before the second poll, in seconds
+            max_delay (float): Upper bound for the delay between polls, in seconds
+
+        Returns:
+            Dict[str, Any]: The transaction receipt
+
+        Raises:
+            TimeExhausted: If the transaction is not mined within the timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        delay = initial_delay
+        while True:
+            try:
+                return await self._web3.eth.get_transaction_receipt(tx_hash)
+            except TransactionNotFound:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise TimeExhausted(
+                        f"Transaction {tx_hash} not mined after {timeout} seconds"
+                    )
+                await asyncio.sleep(min(delay, remaining))
+                delay = min(delay * 1.6, max_delay)
+
     async def send_transaction(
         self, transaction: Dict[str, Any], gas_estimate: bool = True
     ) -> Dict[str, Any]:
@@ -19,5 +19,9 @@ class WalletInstance:
         """Sign and send transaction"""
         pass
 
+    async def wait_for_receipt(self, tx_hash: str) -> Dict[str, Any]:
+        """Wait for a transaction receipt"""
+        pass
+
 
 WalletType = TypeVar("WalletType", bound=WalletInstance)